@@ -0,0 +1,17 @@
+"""
+Optional Numba JIT support
+Shared njit decorator that falls back to plain Python when numba is absent
+"""
+
+# JIT 컴파일 (Numba, 선택사항)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba 미설치 시 순수 Python으로 실행"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
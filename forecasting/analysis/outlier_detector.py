@@ -5,30 +5,139 @@ Petroleum industry specialized anomaly detection
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any, Union
-from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import DBSCAN
-from scipy import stats
-from scipy.signal import find_peaks
+from joblib import Parallel, delayed
 import logging
 from dataclasses import dataclass
 
+from ..config.model_config import TimeSeriesConfig
+from .._numba import njit
+
 logger = logging.getLogger(__name__)
 
+# sklearn IsolationForest는 첫 사용 시 로드 (임포트 비용 절감)
+_ISO = None
+
+def _get_isolation_forest():
+    """IsolationForest 클래스 지연 임포트"""
+    global _ISO
+    if _ISO is None:
+        from sklearn.ensemble import IsolationForest
+        _ISO = IsolationForest
+    return _ISO
+
+def _get_hbos():
+    """PyOD HBOS 클래스 지연 임포트 (미설치 시 None)"""
+    try:
+        from pyod.models.hbos import HBOS
+    except ImportError:
+        return None
+    return HBOS
+
+def _pct_change(values: np.ndarray) -> np.ndarray:
+    """numpy 변화율 (첫 값과 직전 값이 0인 위치는 0)"""
+    pct = np.zeros_like(values)
+    previous = values[:-1]
+    np.divide(np.diff(values), previous, out=pct[1:], where=previous != 0)
+    return pct
+
+@njit(cache=True)
+def _consec_kernel(changes: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """연속 급변동 구간별 최대 변동 위치/크기 탐지 커널"""
+    n = changes.shape[0]
+    positions = np.empty(n // 4 + 1, dtype=np.int64)
+    scores = np.empty(n // 4 + 1, dtype=np.float64)
+    found = 0
+    count = 0
+    
+    for i in range(n):
+        change = changes[i]
+        if np.isnan(change):
+            continue
+        
+        if change > threshold:
+            count += 1
+        else:
+            if count >= 3:  # 3일 이상 연속 급변동
+                # 연속 급변동 구간의 최고점 찾기
+                start = max(0, i - count)
+                best = start
+                for j in range(start + 1, i):
+                    if changes[j] > changes[best]:
+                        best = j
+                positions[found] = best
+                scores[found] = changes[best]
+                found += 1
+            count = 0
+    
+    return positions[:found], scores[:found]
+
+@njit(cache=True)
+def _rolling_std_kernel(values: np.ndarray, window: int) -> np.ndarray:
+    """Welford 온라인 분산 기반 이동 표준편차 (ddof=1, 앞 window-1개는 NaN)"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if window < 2:
+        return out
+    
+    # 윈도우마다 Welford 누적을 새로 시작 (O(N*window)이지만 window가 작음).
+    # 값 추가/제거 방식은 큰 이상치가 윈도우를 벗어난 뒤 M2에 상쇄 오차가 남는다.
+    for end in range(window - 1, n):
+        mean = 0.0
+        m2 = 0.0
+        for k in range(window):
+            x = values[end - window + 1 + k]
+            delta = x - mean
+            mean += delta / (k + 1)
+            m2 += delta * (x - mean)
+        out[end] = np.sqrt(m2 / (window - 1))
+    
+    return out
+
 @dataclass
 class OutlierResult:
-    """이상치 탐지 결과"""
-    outlier_indices: List[int]
-    outlier_scores: List[float]
-    outlier_types: List[str]
-    outlier_dates: List[datetime]
-    outlier_values: List[float]
+    """이상치 탐지 결과 (필드별 numpy 배열)"""
+    outlier_indices: np.ndarray  # int64
+    outlier_scores: np.ndarray   # float64
+    outlier_types: np.ndarray    # object (str)
+    outlier_dates: np.ndarray    # datetime64[ns]
+    outlier_values: np.ndarray   # float64
     total_outliers: int
     outlier_percentage: float
     detection_method: str
     threshold: float
+    
+    def __post_init__(self):
+        # 리스트로 전달된 경우(기존 호출 방식) 배열로 변환
+        self.outlier_indices = np.asarray(self.outlier_indices, dtype=np.int64)
+        self.outlier_scores = np.asarray(self.outlier_scores, dtype=np.float64)
+        self.outlier_types = np.asarray(self.outlier_types, dtype=object)
+        self.outlier_values = np.asarray(self.outlier_values, dtype=np.float64)
+        if not isinstance(self.outlier_dates, np.ndarray):
+            self.outlier_dates = (pd.Index(self.outlier_dates).to_numpy()
+                                  if len(self.outlier_dates) > 0
+                                  else np.array([], dtype='datetime64[ns]'))
+
+@dataclass
+class FeatureBundle:
+    """탐지기 공용 특징 (시리즈당 한 번 계산)"""
+    values: np.ndarray
+    pct_change: np.ndarray
+    abs_pct_change: np.ndarray
+    ma7: Optional[np.ndarray]   # 이동창 특징 (통계적 탐지만 수행 시 None)
+    ma30: Optional[np.ndarray]
+    vol7: Optional[np.ndarray]
+    zscore: np.ndarray
+    modified_zscore: np.ndarray
+    mean: float
+    std: float
+    q1: float
+    q3: float
+    iqr: float
+    mad: float
 
 @dataclass
 class AnomalyProfile:
@@ -49,10 +158,14 @@ class OutlierDetector:
     - 다중 방법 앙상블 탐지
     """
     
-    def __init__(self):
-        self.scaler = StandardScaler()
+    def __init__(self, config: Optional[TimeSeriesConfig] = None):
+        self.config = config or TimeSeriesConfig()
         self.detection_history = []
         
+        # Isolation Forest 학습 결과 캐시 (동일 입력 재계산 방지, LRU)
+        self._iso_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = OrderedDict()
+        self._cache_size = 32
+        
         # 석유업계 도메인 지식 기반 임계값
         self.domain_thresholds = {
             'daily_change_limit': 0.10,      # 일일 변동률 10% 초과 시 이상
@@ -83,21 +196,31 @@ class OutlierDetector:
         logger.info(f"이상치 탐지 시작: {method}, contamination={contamination}")
         
         clean_series = series.dropna()
+        self._validate(clean_series)
         
         if len(clean_series) < 30:
             logger.warning("데이터가 너무 적어 이상치 탐지 스킵")
             return self._empty_result(method, 0.0)
         
+        if method not in ("isolation_forest", "statistical", "domain_based", "ensemble"):
+            raise ValueError(f"Unknown detection method: {method}")
+        
+        # 짧은 시계열은 이동창(7/30일) 특징 대부분이 NaN이므로 통계적 탐지로 대체
+        if method == "ensemble" and len(clean_series) < 100:
+            logger.info(f"시계열이 짧아({len(clean_series)}개) 앙상블 대신 통계적 탐지 수행")
+            method = "statistical"
+        
+        # 공용 특징 1회 계산 후 각 탐지기에 전달
+        features = self._compute_features(clean_series, include_rolling=(method != "statistical"))
+        
         if method == "isolation_forest":
-            result = self._isolation_forest_detection(clean_series, contamination, **kwargs)
+            result = self._isolation_forest_detection(clean_series, features, contamination, **kwargs)
         elif method == "statistical":
-            result = self._statistical_detection(clean_series, **kwargs)
+            result = self._statistical_detection(clean_series, features, **kwargs)
         elif method == "domain_based":
-            result = self._domain_based_detection(clean_series, **kwargs)
-        elif method == "ensemble":
-            result = self._ensemble_detection(clean_series, contamination, **kwargs)
+            result = self._domain_based_detection(clean_series, features, **kwargs)
         else:
-            raise ValueError(f"Unknown detection method: {method}")
+            result = self._ensemble_detection(clean_series, features, contamination, **kwargs)
         
         logger.info(f"이상치 탐지 완료: {result.total_outliers}개 ({result.outlier_percentage:.1f}%)")
         
@@ -136,265 +259,294 @@ class OutlierDetector:
             technical_anomalies=technical
         )
     
+    def _validate(self, series: pd.Series):
+        """입력 검증 (숫자형, 유한값)"""
+        if not pd.api.types.is_numeric_dtype(series.dtype):
+            raise ValueError(f"숫자형 시계열이 필요합니다: dtype={series.dtype}")
+        
+        if not np.isfinite(series.to_numpy(dtype=np.float64)).all():
+            raise ValueError("시계열에 무한대 값이 포함되어 있습니다")
+    
+    def _compute_features(self, series: pd.Series, include_rolling: bool = True) -> FeatureBundle:
+        """탐지기 공용 특징 계산 (변화율, 이동평균, 변동성, Z-score, 분위수)"""
+        values = series.to_numpy(dtype=np.float64)
+        pct_change = _pct_change(values)
+        
+        # Z-score (scipy.stats.zscore와 동일, ddof=0)
+        zscore = (values - values.mean()) / values.std()
+        
+        # MAD가 0이면 Modified Z-score가 NaN/inf가 되므로 하한 적용
+        median = np.median(values)
+        mad = max(np.median(np.abs(values - median)), 1e-12)
+        q1, q3 = np.quantile(values, [0.25, 0.75])
+        
+        # 이동창 특징 (윈도우가 다 차기 전 구간은 명시적으로 NaN)
+        ma7 = ma30 = vol7 = None
+        if include_rolling:
+            ma7 = series.rolling(window=7, min_periods=7).mean().to_numpy(dtype=np.float64)
+            ma30 = series.rolling(window=30, min_periods=30).mean().to_numpy(dtype=np.float64)
+            vol7 = _rolling_std_kernel(values, 7)
+        
+        return FeatureBundle(
+            values=values,
+            pct_change=pct_change,
+            abs_pct_change=np.abs(pct_change),
+            ma7=ma7,
+            ma30=ma30,
+            vol7=vol7,
+            zscore=zscore,
+            modified_zscore=0.6745 * (values - median) / mad,
+            mean=float(series.mean()),
+            std=float(series.std()),
+            q1=float(q1),
+            q3=float(q3),
+            iqr=float(q3 - q1),
+            mad=float(mad)
+        )
+    
     def _isolation_forest_detection(self, 
                                    series: pd.Series,
+                                   features: FeatureBundle,
                                    contamination: float,
                                    **kwargs) -> OutlierResult:
         """Isolation Forest 기반 탐지"""
-        try:
-            # 특징 생성
-            features = self._create_anomaly_features(series)
+        # 특징 생성 (트리 내부 연산과 동일한 float32, C-contiguous)
+        feature_matrix = self._create_anomaly_features(series, features)
+        n_estimators = kwargs.get('n_estimators', 100)
+        
+        # 장기 시계열은 히스토그램 기반 HBOS 사용 (설정으로 활성화)
+        use_hbos = (self.config.outlier_fast_backend and
+                    len(feature_matrix) > self.config.outlier_fast_min_length)
+        hbos_cls = _get_hbos() if use_hbos else None
+        if use_hbos and hbos_cls is None:
+            logger.warning("PyOD 미설치: HBOS 대신 Isolation Forest 사용")
+        
+        cache_key = (
+            'hbos' if hbos_cls is not None else 'iforest',
+            contamination,
+            n_estimators,
+            feature_matrix.shape,
+            hashlib.blake2b(feature_matrix.tobytes(), digest_size=16).digest()
+        )
+        
+        if cache_key in self._iso_cache:
+            self._iso_cache.move_to_end(cache_key)
+            outlier_labels, outlier_scores = self._iso_cache[cache_key]
+        elif hbos_cls is not None:
+            hbos = hbos_cls(n_bins=50, contamination=contamination)
+            hbos.fit(feature_matrix)
+            
+            # score_samples와 같은 방향(낮을수록 이상)으로 맞춤
+            outlier_scores = -hbos.decision_scores_
+            outlier_labels = np.where(hbos.labels_ == 1, -1, 1)
             
+            self._iso_cache[cache_key] = (outlier_labels, outlier_scores)
+            if len(self._iso_cache) > self._cache_size:
+                self._iso_cache.popitem(last=False)
+        else:
             # 모델 학습
-            iso_forest = IsolationForest(
+            iso_forest = _get_isolation_forest()(
                 contamination=contamination,
                 random_state=42,
-                n_estimators=kwargs.get('n_estimators', 100)
+                n_estimators=n_estimators,
+                max_samples=min(256, len(feature_matrix)),
+                n_jobs=-1
             )
             
-            outlier_labels = iso_forest.fit_predict(features)
-            outlier_scores = iso_forest.score_samples(features)
-            
-            # 결과 정리
-            outlier_mask = outlier_labels == -1
-            outlier_indices = np.where(outlier_mask)[0]
+            # fit_predict + score_samples 대신 점수 1회 계산 후 임계값으로 라벨링
+            iso_forest.fit(feature_matrix)
+            outlier_scores = iso_forest.score_samples(feature_matrix)
+            outlier_labels = np.where(outlier_scores < iso_forest.offset_, -1, 1)
             
-            return OutlierResult(
-                outlier_indices=outlier_indices.tolist(),
-                outlier_scores=outlier_scores[outlier_mask].tolist(),
-                outlier_types=['isolation_forest'] * len(outlier_indices),
-                outlier_dates=[series.index[i] for i in outlier_indices],
-                outlier_values=[series.iloc[i] for i in outlier_indices],
-                total_outliers=len(outlier_indices),
-                outlier_percentage=(len(outlier_indices) / len(series)) * 100,
-                detection_method='isolation_forest',
-                threshold=contamination
-            )
-            
-        except Exception as e:
-            logger.error(f"Isolation Forest 탐지 실패: {e}")
-            return self._empty_result('isolation_forest', contamination)
+            self._iso_cache[cache_key] = (outlier_labels, outlier_scores)
+            if len(self._iso_cache) > self._cache_size:
+                self._iso_cache.popitem(last=False)
+        
+        # 결과 정리
+        outlier_mask = outlier_labels == -1
+        outlier_indices = np.where(outlier_mask)[0]
+        
+        return OutlierResult(
+            outlier_indices=outlier_indices,
+            outlier_scores=outlier_scores[outlier_mask],
+            outlier_types=np.full(len(outlier_indices), 'isolation_forest', dtype=object),
+            outlier_dates=series.index[outlier_indices].to_numpy(),
+            outlier_values=features.values[outlier_indices],
+            total_outliers=len(outlier_indices),
+            outlier_percentage=(len(outlier_indices) / len(series)) * 100,
+            detection_method='isolation_forest',
+            threshold=contamination
+        )
     
     def _statistical_detection(self, 
                              series: pd.Series,
+                             features: FeatureBundle,
                              z_threshold: float = 3.0,
                              **kwargs) -> OutlierResult:
         """통계적 방법 기반 탐지"""
-        try:
-            # Z-score 계산
-            z_scores = np.abs(stats.zscore(series.values))
-            
-            # Modified Z-score (더 robust)
-            median = np.median(series.values)
-            mad = np.median(np.abs(series.values - median))
-            modified_z_scores = 0.6745 * (series.values - median) / mad
-            
-            # IQR 방법
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
-            IQR = Q3 - Q1
-            iqr_lower = Q1 - 1.5 * IQR
-            iqr_upper = Q3 + 1.5 * IQR
-            
-            # 복합 이상치 판별
-            outlier_mask = (
-                (z_scores > z_threshold) |
-                (np.abs(modified_z_scores) > 3.5) |
-                (series < iqr_lower) |
-                (series > iqr_upper)
-            )
-            
-            outlier_indices = np.where(outlier_mask)[0]
-            outlier_scores = z_scores[outlier_mask]
-            
-            return OutlierResult(
-                outlier_indices=outlier_indices.tolist(),
-                outlier_scores=outlier_scores.tolist(),
-                outlier_types=['statistical'] * len(outlier_indices),
-                outlier_dates=[series.index[i] for i in outlier_indices],
-                outlier_values=[series.iloc[i] for i in outlier_indices],
-                total_outliers=len(outlier_indices),
-                outlier_percentage=(len(outlier_indices) / len(series)) * 100,
-                detection_method='statistical',
-                threshold=z_threshold
-            )
-            
-        except Exception as e:
-            logger.error(f"통계적 탐지 실패: {e}")
-            return self._empty_result('statistical', z_threshold)
+        # Z-score / Modified Z-score (더 robust)
+        z_scores = np.abs(features.zscore)
+        modified_z_scores = features.modified_zscore
+        
+        # IQR 방법
+        iqr_lower = features.q1 - 1.5 * features.iqr
+        iqr_upper = features.q3 + 1.5 * features.iqr
+        
+        # 복합 이상치 판별
+        values = features.values
+        outlier_mask = np.logical_or.reduce([
+            z_scores > z_threshold,
+            np.abs(modified_z_scores) > 3.5,
+            values < iqr_lower,
+            values > iqr_upper
+        ])
+        
+        outlier_indices = np.where(outlier_mask)[0]
+        outlier_scores = z_scores[outlier_mask]
+        
+        return OutlierResult(
+            outlier_indices=outlier_indices,
+            outlier_scores=outlier_scores,
+            outlier_types=np.full(len(outlier_indices), 'statistical', dtype=object),
+            outlier_dates=series.index[outlier_indices].to_numpy(),
+            outlier_values=features.values[outlier_indices],
+            total_outliers=len(outlier_indices),
+            outlier_percentage=(len(outlier_indices) / len(series)) * 100,
+            detection_method='statistical',
+            threshold=z_threshold
+        )
     
     def _domain_based_detection(self, 
                               series: pd.Series,
+                              features: FeatureBundle,
                               **kwargs) -> OutlierResult:
         """석유업계 도메인 지식 기반 탐지"""
-        try:
-            outlier_indices = []
-            outlier_scores = []
-            outlier_types = []
-            
-            # 일일 변동률 이상치
-            daily_changes = series.pct_change().abs()
-            daily_outliers = daily_changes > self.domain_thresholds['daily_change_limit']
-            
-            for idx in daily_changes[daily_outliers].index:
-                pos = series.index.get_loc(idx)
-                outlier_indices.append(pos)
-                outlier_scores.append(daily_changes[idx])
-                outlier_types.append('daily_spike')
-            
-            # 주간 변동성 이상치
-            weekly_volatility = series.rolling(window=7).std()
-            weekly_outliers = weekly_volatility > self.domain_thresholds['weekly_volatility_limit'] * series.std()
-            
-            for idx in weekly_volatility[weekly_outliers].index:
-                pos = series.index.get_loc(idx)
-                if pos not in outlier_indices:
-                    outlier_indices.append(pos)
-                    outlier_scores.append(weekly_volatility[idx])
-                    outlier_types.append('volatility_spike')
-            
-            # 연속적 급등/급락 (공급 차질 가능성)
-            consecutive_changes = self._detect_consecutive_changes(series)
-            for pos, score in consecutive_changes:
-                if pos not in outlier_indices:
-                    outlier_indices.append(pos)
-                    outlier_scores.append(score)
-                    outlier_types.append('supply_disruption')
-            
-            return OutlierResult(
-                outlier_indices=outlier_indices,
-                outlier_scores=outlier_scores,
-                outlier_types=outlier_types,
-                outlier_dates=[series.index[i] for i in outlier_indices],
-                outlier_values=[series.iloc[i] for i in outlier_indices],
-                total_outliers=len(outlier_indices),
-                outlier_percentage=(len(outlier_indices) / len(series)) * 100,
-                detection_method='domain_based',
-                threshold=self.domain_thresholds['daily_change_limit']
-            )
-            
-        except Exception as e:
-            logger.error(f"도메인 기반 탐지 실패: {e}")
-            return self._empty_result('domain_based', 0.1)
+        # 일일 변동률 이상치
+        daily_changes = features.abs_pct_change
+        daily_pos = np.flatnonzero(daily_changes > self.domain_thresholds['daily_change_limit'])
+        
+        # 주간 변동성 이상치
+        weekly_volatility = features.vol7
+        weekly_outliers = weekly_volatility > self.domain_thresholds['weekly_volatility_limit'] * features.std
+        vol_pos = np.setdiff1d(np.flatnonzero(weekly_outliers), daily_pos, assume_unique=True)
+        
+        # 연속적 급등/급락 (공급 차질 가능성)
+        consecutive_changes = self._detect_consecutive_changes(features)
+        flagged = set(daily_pos.tolist()) | set(vol_pos.tolist())
+        consecutive_changes = [(pos, score) for pos, score in consecutive_changes if pos not in flagged]
+        
+        outlier_indices = (daily_pos.tolist() + vol_pos.tolist() +
+                           [pos for pos, _ in consecutive_changes])
+        outlier_scores = (daily_changes[daily_pos].tolist() + weekly_volatility[vol_pos].tolist() +
+                          [score for _, score in consecutive_changes])
+        outlier_types = (['daily_spike'] * len(daily_pos) + ['volatility_spike'] * len(vol_pos) +
+                         ['supply_disruption'] * len(consecutive_changes))
+        positions = np.asarray(outlier_indices, dtype=np.int64)
+        
+        return OutlierResult(
+            outlier_indices=positions,
+            outlier_scores=outlier_scores,
+            outlier_types=outlier_types,
+            outlier_dates=series.index[positions].to_numpy(),
+            outlier_values=features.values[positions],
+            total_outliers=len(outlier_indices),
+            outlier_percentage=(len(outlier_indices) / len(series)) * 100,
+            detection_method='domain_based',
+            threshold=self.domain_thresholds['daily_change_limit']
+        )
     
     def _ensemble_detection(self, 
                           series: pd.Series,
+                          features: FeatureBundle,
                           contamination: float,
                           **kwargs) -> OutlierResult:
         """앙상블 방법 기반 탐지"""
-        try:
-            # 각 방법별 탐지 수행
-            iso_result = self._isolation_forest_detection(series, contamination)
-            stat_result = self._statistical_detection(series)
-            domain_result = self._domain_based_detection(series)
-            
-            # 투표 기반 앙상블
-            all_indices = set()
-            vote_counts = {}
-            score_sums = {}
-            type_info = {}
-            
-            # 각 방법의 결과 집계
-            for result, method in [(iso_result, 'iso'), (stat_result, 'stat'), (domain_result, 'domain')]:
-                for i, idx in enumerate(result.outlier_indices):
-                    all_indices.add(idx)
-                    vote_counts[idx] = vote_counts.get(idx, 0) + 1
-                    score_sums[idx] = score_sums.get(idx, 0) + result.outlier_scores[i]
-                    
-                    if idx not in type_info:
-                        type_info[idx] = []
-                    type_info[idx].append(f"{method}:{result.outlier_types[i]}")
-            
-            # 2표 이상 받은 이상치만 선택
-            min_votes = kwargs.get('min_votes', 2)
-            final_outliers = [idx for idx in all_indices if vote_counts[idx] >= min_votes]
-            
-            return OutlierResult(
-                outlier_indices=final_outliers,
-                outlier_scores=[score_sums[idx] / vote_counts[idx] for idx in final_outliers],
-                outlier_types=[','.join(type_info[idx]) for idx in final_outliers],
-                outlier_dates=[series.index[i] for i in final_outliers],
-                outlier_values=[series.iloc[i] for i in final_outliers],
-                total_outliers=len(final_outliers),
-                outlier_percentage=(len(final_outliers) / len(series)) * 100,
-                detection_method='ensemble',
-                threshold=min_votes
-            )
-            
-        except Exception as e:
-            logger.error(f"앙상블 탐지 실패: {e}")
-            return self._empty_result('ensemble', contamination)
+        # 각 방법별 탐지 수행 (서로 독립적이므로 스레드 병렬 실행)
+        iso_result, stat_result, domain_result = Parallel(n_jobs=3, prefer='threads')([
+            delayed(self._isolation_forest_detection)(series, features, contamination),
+            delayed(self._statistical_detection)(series, features),
+            delayed(self._domain_based_detection)(series, features)
+        ])
+        
+        # 투표 기반 앙상블 (인덱스 범위가 [0, N)이므로 배열로 집계)
+        sub_results = [(iso_result, 'iso'), (stat_result, 'stat'), (domain_result, 'domain')]
+        vote_counts = np.zeros(len(series), dtype=np.int8)
+        score_sums = np.zeros(len(series), dtype=np.float64)
+        
+        # 각 방법의 결과 집계
+        for result, _ in sub_results:
+            np.add.at(vote_counts, result.outlier_indices, 1)
+            np.add.at(score_sums, result.outlier_indices, result.outlier_scores)
+        
+        # 2표 이상 받은 이상치만 선택
+        min_votes = kwargs.get('min_votes', 2)
+        final_outliers = np.flatnonzero(vote_counts >= min_votes)
+        
+        # 유형 정보는 최종 이상치에 대해서만 구성
+        type_info = {idx: [] for idx in final_outliers.tolist()}
+        for result, method in sub_results:
+            for idx, outlier_type in zip(result.outlier_indices.tolist(), result.outlier_types):
+                if idx in type_info:
+                    type_info[idx].append(f"{method}:{outlier_type}")
+        
+        return OutlierResult(
+            outlier_indices=final_outliers,
+            outlier_scores=score_sums[final_outliers] / vote_counts[final_outliers],
+            outlier_types=[','.join(types) for types in type_info.values()],
+            outlier_dates=series.index[final_outliers].to_numpy(),
+            outlier_values=features.values[final_outliers],
+            total_outliers=len(final_outliers),
+            outlier_percentage=(len(final_outliers) / len(series)) * 100,
+            detection_method='ensemble',
+            threshold=min_votes
+        )
     
-    def _create_anomaly_features(self, series: pd.Series) -> np.ndarray:
-        """이상치 탐지를 위한 특징 생성"""
-        features = []
+    def _create_anomaly_features(self, series: pd.Series, features: FeatureBundle) -> np.ndarray:
+        """이상치 탐지를 위한 특징 생성 (float32, C-order 행렬에 직접 기록)"""
+        values = features.values
+        feature_matrix = np.empty((len(values), 6), dtype=np.float32, order='C')
         
         # 원본 값
-        features.append(series.values)
+        feature_matrix[:, 0] = values
         
         # 변화율
-        pct_changes = series.pct_change().fillna(0).values
-        features.append(pct_changes)
+        feature_matrix[:, 1] = np.nan_to_num(features.pct_change, nan=0.0)
         
         # 이동평균과의 차이
-        ma7 = series.rolling(window=7).mean().fillna(series.mean()).values
-        ma30 = series.rolling(window=30).mean().fillna(series.mean()).values
-        features.append(series.values - ma7)
-        features.append(series.values - ma30)
+        feature_matrix[:, 2] = values - np.nan_to_num(features.ma7, nan=features.mean)
+        feature_matrix[:, 3] = values - np.nan_to_num(features.ma30, nan=features.mean)
         
         # 변동성
-        volatility = series.rolling(window=7).std().fillna(series.std()).values
-        features.append(volatility)
+        feature_matrix[:, 4] = np.nan_to_num(features.vol7, nan=features.std)
         
         # Z-score
-        z_scores = stats.zscore(series.values)
-        features.append(z_scores)
+        feature_matrix[:, 5] = features.zscore
         
-        return np.column_stack(features)
+        return feature_matrix
     
-    def _detect_consecutive_changes(self, series: pd.Series) -> List[Tuple[int, float]]:
+    def _detect_consecutive_changes(self, features: FeatureBundle) -> List[Tuple[int, float]]:
         """연속적 급변동 탐지"""
-        changes = series.pct_change().abs()
         threshold = self.domain_thresholds['supply_disruption_threshold']
         
-        consecutive_outliers = []
-        consecutive_count = 0
-        
-        for i, change in enumerate(changes):
-            if pd.isna(change):
-                continue
-                
-            if change > threshold:
-                consecutive_count += 1
-            else:
-                if consecutive_count >= 3:  # 3일 이상 연속 급변동
-                    # 연속 급변동 구간의 최고점 찾기
-                    start_idx = max(0, i - consecutive_count)
-                    end_idx = min(len(series), i)
-                    max_change_idx = start_idx + changes.iloc[start_idx:end_idx].idxmax()
-                    max_change_score = changes.iloc[max_change_idx]
-                    
-                    consecutive_outliers.append((max_change_idx, max_change_score))
-                
-                consecutive_count = 0
-        
-        return consecutive_outliers
+        positions, scores = _consec_kernel(features.abs_pct_change, threshold)
+        
+        return list(zip(positions.tolist(), scores.tolist()))
     
     def _detect_geopolitical_events(self, 
                                    series: pd.Series, 
                                    price_changes: pd.Series) -> List[Tuple[datetime, str, float]]:
         """지정학적 이벤트 탐지 (급등 패턴)"""
-        events = []
-        
         # 급격한 가격 상승 (3% 이상)
         sharp_increases = price_changes > 0.03
         
-        for date in price_changes[sharp_increases].index:
-            # 이후 5일간 지속적 상승 확인
-            future_window = price_changes.loc[date:date + timedelta(days=5)]
-            if len(future_window) >= 3 and future_window.mean() > 0.01:
-                severity = price_changes[date]
-                events.append((date, "geopolitical_tension", severity))
+        # 이후 5일간 지속적 상승 확인 (당일 포함 6일 전방 윈도우, 일별 데이터 기준)
+        forward = pd.api.indexers.FixedForwardWindowIndexer(window_size=6)
+        forward_mean = price_changes.rolling(forward, min_periods=3).mean()
+        
+        mask = sharp_increases & (forward_mean > 0.01)
+        events = list(zip(price_changes.index[mask],
+                          ["geopolitical_tension"] * int(mask.sum()),
+                          price_changes[mask].tolist()))
         
         return events
     
@@ -402,19 +554,17 @@ class OutlierDetector:
                               series: pd.Series, 
                               price_changes: pd.Series) -> List[Tuple[datetime, str, float]]:
         """시장 급락 탐지"""
-        crashes = []
-        
         # 급격한 가격 하락 (5% 이상)
         sharp_decreases = price_changes < -0.05
         
-        for date in price_changes[sharp_decreases].index:
-            # 이후 복구 패턴 확인
-            future_window = price_changes.loc[date:date + timedelta(days=10)]
-            if len(future_window) >= 5:
-                recovery_rate = future_window[future_window > 0].sum()
-                if recovery_rate > 0.02:  # 2% 이상 복구
-                    severity = abs(price_changes[date])
-                    crashes.append((date, "market_crash", severity))
+        # 이후 복구 패턴 확인 (당일 포함 11일 전방 윈도우의 상승분 합계)
+        forward = pd.api.indexers.FixedForwardWindowIndexer(window_size=11)
+        recovery_rate = price_changes.clip(lower=0).rolling(forward, min_periods=5).sum()
+        
+        mask = sharp_decreases & (recovery_rate > 0.02)  # 2% 이상 복구
+        crashes = list(zip(price_changes.index[mask],
+                           ["market_crash"] * int(mask.sum()),
+                           price_changes[mask].abs().tolist()))
         
         return crashes
     
@@ -443,17 +593,21 @@ class OutlierDetector:
         
         # 급격한 수요 변화 (계절성 고려)
         if isinstance(series.index, pd.DatetimeIndex):
-            # 같은 월 평균과 비교
-            for date in series.index:
-                month = date.month
-                same_month_data = series[series.index.month == month]
-                same_month_mean = same_month_data.mean()
-                
-                current_value = series[date]
-                deviation = abs(current_value - same_month_mean) / same_month_mean
-                
-                if deviation > 0.08:  # 같은 월 평균 대비 8% 이상 차이
-                    shocks.append((date, "demand_shock", deviation))
+            # 같은 월 평균과 비교 (월 코드 기준 bincount로 12개월 평균 계산, NaN 제외)
+            values = series.to_numpy(dtype=np.float64)
+            month_idx = pd.Categorical(series.index.month, categories=range(1, 13)).codes
+            valid = ~np.isnan(values)
+            month_sum = np.bincount(month_idx, weights=np.where(valid, values, 0.0), minlength=12)
+            month_count = np.bincount(month_idx, weights=valid, minlength=12)
+            month_mean = month_sum / np.maximum(month_count, 1)
+            
+            monthly = month_mean[month_idx]
+            deviation = np.abs(values - monthly) / monthly
+            
+            mask = deviation > 0.08  # 같은 월 평균 대비 8% 이상 차이
+            shocks = list(zip(series.index[mask],
+                              ["demand_shock"] * int(mask.sum()),
+                              deviation[mask].tolist()))
         
         return shocks
     
@@ -478,11 +632,11 @@ class OutlierDetector:
     def _empty_result(self, method: str, threshold: float) -> OutlierResult:
         """빈 결과 반환"""
         return OutlierResult(
-            outlier_indices=[],
-            outlier_scores=[],
-            outlier_types=[],
-            outlier_dates=[],
-            outlier_values=[],
+            outlier_indices=np.array([], dtype=np.int64),
+            outlier_scores=np.array([], dtype=np.float64),
+            outlier_types=np.array([], dtype=object),
+            outlier_dates=np.array([], dtype='datetime64[ns]'),
+            outlier_values=np.array([], dtype=np.float64),
             total_outliers=0,
             outlier_percentage=0.0,
             detection_method=method,
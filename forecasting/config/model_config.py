@@ -4,11 +4,12 @@ Optimized parameters based on 30 years of petroleum industry analysis
 """
 
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import json
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field, is_dataclass, replace, asdict
 from pathlib import Path
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataConfig:
     """데이터 설정"""
     data_path: str = "data/processed"
@@ -19,21 +20,15 @@ class DataConfig:
     national_file: str = "national_gas_prices.json"
     
     # 지역별 코드
-    regions: List[str] = None
-    fuel_types: List[str] = None
-    
-    def __post_init__(self):
-        if self.regions is None:
-            self.regions = [
-                "seoul", "busan", "daegu", "incheon", "gwangju", 
-                "daejeon", "ulsan", "gyeonggi", "gangwon", "chungbuk",
-                "chungnam", "jeonbuk", "jeonnam", "gyeongbuk", 
-                "gyeongnam", "jeju", "sejong"
-            ]
-        if self.fuel_types is None:
-            self.fuel_types = ["gasoline", "diesel"]
+    regions: Tuple[str, ...] = field(default_factory=lambda: (
+        "seoul", "busan", "daegu", "incheon", "gwangju", 
+        "daejeon", "ulsan", "gyeonggi", "gangwon", "chungbuk",
+        "chungnam", "jeonbuk", "jeonnam", "gyeongbuk", 
+        "gyeongnam", "jeju", "sejong"
+    ))
+    fuel_types: Tuple[str, ...] = field(default_factory=lambda: ("gasoline", "diesel"))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeSeriesConfig:
     """시계열 분석 설정"""
     # 예측 기간
@@ -47,13 +42,15 @@ class TimeSeriesConfig:
     # 이상치 탐지
     outlier_method: str = "isolation_forest"  # z_score, iqr, isolation_forest
     outlier_threshold: float = 0.1
+    outlier_fast_backend: bool = False   # 장기 시계열은 PyOD HBOS로 대체 (재현성 위해 기본 비활성)
+    outlier_fast_min_length: int = 5000  # HBOS 사용 최소 길이
     
     # COVID-19 기간 처리
     covid_start: str = "2020-01-01"
     covid_end: str = "2022-06-30"
     covid_handling: str = "interpolate"  # remove, interpolate, weight
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ARIMAConfig:
     """ARIMA 모델 설정"""
     max_p: int = 5
@@ -67,11 +64,12 @@ class ARIMAConfig:
     
     # 자동 ARIMA 설정
     auto_arima: bool = True
+    backend: str = "pmdarima"  # pmdarima, statsforecast (Numba JIT)
     seasonal_test: str = "ch"  # ch, ocsb
     stepwise: bool = True
     suppress_warnings: bool = True
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LSTMConfig:
     """LSTM 모델 설정"""
     # 네트워크 구조
@@ -97,7 +95,7 @@ class LSTMConfig:
     # GPU 설정
     device: str = "auto"  # auto, cpu, cuda
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RandomForestConfig:
     """Random Forest 모델 설정"""
     n_estimators: int = 500
@@ -112,7 +110,7 @@ class RandomForestConfig:
     # 특징 중요도 임계값
     feature_importance_threshold: float = 0.01
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EnsembleConfig:
     """앙상블 모델 설정"""
     # 모델 가중치 (동적 조정)
@@ -128,7 +126,7 @@ class EnsembleConfig:
     min_weight: float = 0.1
     max_weight: float = 0.6
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationConfig:
     """검증 설정"""
     # 교차 검증
@@ -138,50 +136,72 @@ class ValidationConfig:
     validation_size: float = 0.1
     
     # 백테스팅
-    backtest_periods: List[int] = None
+    backtest_periods: Tuple[int, ...] = field(
+        default_factory=lambda: (30, 60, 90, 180)  # 다양한 백테스팅 기간
+    )
     rolling_window: bool = True
     
     # 성능 지표
-    metrics: List[str] = None
+    metrics: Tuple[str, ...] = field(
+        default_factory=lambda: ("mape", "rmse", "mae", "r2", "directional_accuracy")
+    )
     target_accuracy: float = 0.95  # 95% 목표 정확도
-    
-    def __post_init__(self):
-        if self.backtest_periods is None:
-            self.backtest_periods = [30, 60, 90, 180]  # 다양한 백테스팅 기간
-        if self.metrics is None:
-            self.metrics = ["mape", "rmse", "mae", "r2", "directional_accuracy"]
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeatureConfig:
     """특징 엔지니어링 설정"""
     # 시계열 특징
-    lag_features: List[int] = None
-    rolling_features: List[int] = None
-    diff_features: List[int] = None
+    lag_features: Tuple[int, ...] = field(default_factory=lambda: (1, 2, 3, 7, 14, 21, 30))
+    rolling_features: Tuple[int, ...] = field(default_factory=lambda: (7, 14, 30, 60))
+    diff_features: Tuple[int, ...] = field(default_factory=lambda: (1, 7))
     
     # 계절성 특징
     seasonal_features: bool = True
     holiday_features: bool = True
     
     # 외부 요인 특징
-    oil_price_lags: List[int] = None
-    exchange_rate_lags: List[int] = None
+    oil_price_lags: Tuple[int, ...] = field(default_factory=lambda: (0, 1, 2, 3, 7))
+    exchange_rate_lags: Tuple[int, ...] = field(default_factory=lambda: (0, 1, 2, 3))
     
     # 지역별 특징
     regional_clustering: bool = True
     price_spread_features: bool = True
-    
-    def __post_init__(self):
-        if self.lag_features is None:
-            self.lag_features = [1, 2, 3, 7, 14, 21, 30]
-        if self.rolling_features is None:
-            self.rolling_features = [7, 14, 30, 60]
-        if self.diff_features is None:
-            self.diff_features = [1, 7]
-        if self.oil_price_lags is None:
-            self.oil_price_lags = [0, 1, 2, 3, 7]
-        if self.exchange_rate_lags is None:
-            self.exchange_rate_lags = [0, 1, 2, 3]
+
+# 모델별 반환 파라미터 키 -> 설정 필드 이름
+MODEL_PARAM_FIELDS = {
+    "arima": {
+        "max_p": "max_p",
+        "max_d": "max_d",
+        "max_q": "max_q",
+        "seasonal": "seasonal",
+        "m": "seasonal_period",
+        "information_criterion": "information_criterion",
+        "method": "method",
+        "maxiter": "maxiter"
+    },
+    "lstm": {
+        "hidden_size": "hidden_size",
+        "num_layers": "num_layers",
+        "dropout": "dropout",
+        "bidirectional": "bidirectional",
+        "sequence_length": "sequence_length",
+        "batch_size": "batch_size",
+        "epochs": "epochs",
+        "learning_rate": "learning_rate",
+        "weight_decay": "weight_decay",
+        "patience": "patience"
+    },
+    "rf": {
+        "n_estimators": "n_estimators",
+        "max_depth": "max_depth",
+        "min_samples_split": "min_samples_split",
+        "min_samples_leaf": "min_samples_leaf",
+        "max_features": "max_features",
+        "bootstrap": "bootstrap",
+        "random_state": "random_state",
+        "n_jobs": "n_jobs"
+    }
+}
 
 class ModelConfigManager:
     """모델 설정 관리자"""
@@ -196,58 +216,45 @@ class ModelConfigManager:
         self.validation = ValidationConfig()
         self.features = FeatureConfig()
         
+        self._params = self._build_model_params()
+        
         if config_path and os.path.exists(config_path):
             self.load_config(config_path)
     
     def load_config(self, config_path: str):
-        """외부 설정 파일 로드"""
-        # JSON 또는 YAML 설정 파일 로드 로직
-        pass
+        """외부 설정 파일 로드 (JSON, 섹션별 값으로 기본 설정을 덮어씀)"""
+        with open(config_path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+        
+        for section, values in overrides.items():
+            current = getattr(self, section, None)
+            if not is_dataclass(current):
+                raise ValueError(f"Unknown config section: {section}")
+            
+            # 설정 객체는 불변이므로 변경된 값으로 새 인스턴스 생성
+            values = {k: tuple(v) if isinstance(v, list) else v for k, v in values.items()}
+            setattr(self, section, replace(current, **values))
+        
+        self._params = self._build_model_params()
     
     def save_config(self, config_path: str):
         """설정을 파일로 저장"""
         # JSON 또는 YAML로 설정 저장 로직
         pass
     
+    def _build_model_params(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 파라미터 테이블 생성 (설정 변경 시에만 재계산)"""
+        params = {}
+        for model_type, param_fields in MODEL_PARAM_FIELDS.items():
+            values = asdict(getattr(self, model_type))
+            params[model_type] = {key: values[name] for key, name in param_fields.items()}
+        return params
+    
     def get_model_params(self, model_type: str) -> Dict[str, Any]:
         """모델별 파라미터 반환"""
-        if model_type == "arima":
-            return {
-                "max_p": self.arima.max_p,
-                "max_d": self.arima.max_d,
-                "max_q": self.arima.max_q,
-                "seasonal": self.arima.seasonal,
-                "m": self.arima.seasonal_period,
-                "information_criterion": self.arima.information_criterion,
-                "method": self.arima.method,
-                "maxiter": self.arima.maxiter
-            }
-        elif model_type == "lstm":
-            return {
-                "hidden_size": self.lstm.hidden_size,
-                "num_layers": self.lstm.num_layers,
-                "dropout": self.lstm.dropout,
-                "bidirectional": self.lstm.bidirectional,
-                "sequence_length": self.lstm.sequence_length,
-                "batch_size": self.lstm.batch_size,
-                "epochs": self.lstm.epochs,
-                "learning_rate": self.lstm.learning_rate,
-                "weight_decay": self.lstm.weight_decay,
-                "patience": self.lstm.patience
-            }
-        elif model_type == "rf":
-            return {
-                "n_estimators": self.rf.n_estimators,
-                "max_depth": self.rf.max_depth,
-                "min_samples_split": self.rf.min_samples_split,
-                "min_samples_leaf": self.rf.min_samples_leaf,
-                "max_features": self.rf.max_features,
-                "bootstrap": self.rf.bootstrap,
-                "random_state": self.rf.random_state,
-                "n_jobs": self.rf.n_jobs
-            }
-        else:
+        if model_type not in self._params:
             raise ValueError(f"Unknown model type: {model_type}")
+        return self._params[model_type].copy()
 
 # 글로벌 설정 인스턴스
 config = ModelConfigManager()
\ No newline at end of file
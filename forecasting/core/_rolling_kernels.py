@@ -0,0 +1,176 @@
+"""
+Rolling window kernels for feature engineering
+Single-pass Numba implementations shared by the feature pipeline
+"""
+
+import numpy as np
+
+from .._numba import njit
+
+
+@njit(cache=True, nogil=True)
+def roll_mean_std_min_max(a: np.ndarray, w: int):
+    """
+    이동 평균/표준편차(ddof=1)/최소/최대를 한 번의 순회로 계산
+
+    pandas rolling(w)과 같이 처음 w-1개와 결측값이 포함된 창은 NaN.
+    합계는 기준값만큼 이동해 누적하되 창 길이마다 기준값을 갱신하고 다시 계산해
+    상쇄 오차를 제한하며,
+    최소/최대는 인덱스 배열로 구현한 단조 덱으로 유지
+    """
+    n = a.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    rmin = np.full(n, np.nan)
+    rmax = np.full(n, np.nan)
+    if w <= 0 or n == 0:
+        return mean, std, rmin, rmax
+
+    shift = 0.0
+    for i in range(n):
+        if not np.isnan(a[i]):
+            shift = a[i]
+            break
+
+    total = 0.0
+    total_sq = 0.0
+    nan_count = 0
+    min_q = np.empty(n, dtype=np.int64)
+    max_q = np.empty(n, dtype=np.int64)
+    min_head = 0
+    min_tail = 0
+    max_head = 0
+    max_tail = 0
+
+    for i in range(n):
+        x = a[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            d = x - shift
+            total += d
+            total_sq += d * d
+            while min_tail > min_head and a[min_q[min_tail - 1]] >= x:
+                min_tail -= 1
+            min_q[min_tail] = i
+            min_tail += 1
+            while max_tail > max_head and a[max_q[max_tail - 1]] <= x:
+                max_tail -= 1
+            max_q[max_tail] = i
+            max_tail += 1
+
+        # 창에서 빠지는 값 제거
+        if i >= w:
+            old = a[i - w]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                d = old - shift
+                total -= d
+                total_sq -= d * d
+        # 누적 오차가 쌓이지 않도록 창 길이마다 기준값을 현재 값으로 옮기고
+        # 합계를 다시 계산 (분할 상환 O(1))
+        if i >= w - 1 and i % w == 0:
+            if not np.isnan(x):
+                shift = x
+            total = 0.0
+            total_sq = 0.0
+            for j in range(i - w + 1, i + 1):
+                if not np.isnan(a[j]):
+                    d = a[j] - shift
+                    total += d
+                    total_sq += d * d
+        while min_head < min_tail and min_q[min_head] <= i - w:
+            min_head += 1
+        while max_head < max_tail and max_q[max_head] <= i - w:
+            max_head += 1
+
+        if i >= w - 1 and nan_count == 0:
+            m = total / w
+            mean[i] = m + shift
+            if w > 1:
+                var = (total_sq - total * m) / (w - 1)
+                std[i] = np.sqrt(var) if var > 0.0 else 0.0
+            rmin[i] = a[min_q[min_head]]
+            rmax[i] = a[max_q[max_head]]
+
+    return mean, std, rmin, rmax
+
+
+@njit(cache=True, nogil=True)
+def _ewma_update(weighted: float, old_wt: float, cur: float, alpha: float):
+    """지수가중평균 한 단계 갱신 (pandas ewm(adjust=True).mean()과 동일한 점화식)"""
+    if not np.isnan(weighted):
+        old_wt *= 1.0 - alpha
+        if not np.isnan(cur):
+            if weighted != cur:
+                weighted = (old_wt * weighted + cur) / (old_wt + 1.0)
+            old_wt += 1.0
+    elif not np.isnan(cur):
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True, nogil=True)
+def macd_kernel(p: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9):
+    """
+    MACD, 시그널, 히스토그램을 한 번의 순회로 계산
+
+    ewm(span=fast/slow/signal).mean() 세 번과 같은 결과를 단일 루프에서 생성
+    """
+    n = p.shape[0]
+    macd = np.empty(n)
+    macd_signal = np.empty(n)
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_signal = 2.0 / (signal + 1.0)
+
+    ema_fast, wt_fast = np.nan, 1.0
+    ema_slow, wt_slow = np.nan, 1.0
+    ema_signal, wt_signal = np.nan, 1.0
+    for i in range(n):
+        ema_fast, wt_fast = _ewma_update(ema_fast, wt_fast, p[i], alpha_fast)
+        ema_slow, wt_slow = _ewma_update(ema_slow, wt_slow, p[i], alpha_slow)
+        macd[i] = ema_fast - ema_slow
+        ema_signal, wt_signal = _ewma_update(ema_signal, wt_signal, macd[i], alpha_signal)
+        macd_signal[i] = ema_signal
+
+    return macd, macd_signal, macd - macd_signal
+
+
+@njit(cache=True, nogil=True)
+def rsi_wilder(p: np.ndarray, period: int = 14):
+    """
+    Wilder 평활 RSI를 한 번의 순회로 계산
+
+    첫 period개 가격 변화의 단순 평균으로 시작해 이후 (avg*(period-1)+x)/period 점화식으로 갱신.
+    결측 가격이 포함된 변화는 건너뛰며(해당 시점은 NaN) 평균 하락폭이 0이면 100
+    """
+    n = p.shape[0]
+    out = np.full(n, np.nan)
+    if period <= 0:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    count = 0
+    for i in range(1, n):
+        d = p[i] - p[i - 1]
+        if np.isnan(d):
+            continue
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+        if count < period:
+            avg_gain += gain
+            avg_loss += loss
+            count += 1
+            if count < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0.0 else 100.0
+
+    return out
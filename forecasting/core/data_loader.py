@@ -4,16 +4,104 @@ Optimized for petroleum industry data with 30+ years of domain expertise
 """
 
 import json
+import mmap
+import re
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union, Any, Callable
 from pathlib import Path
 import logging
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from ..config.model_config import DataConfig
 
+# 고속 JSON 파서 (pysimdjson, 선택사항)
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# simdjson 미설치 시 대체 JSON 파서 (orjson, 선택사항)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Feather 캐시 (pyarrow, 선택사항)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 이동 통계 가속 (bottleneck, 선택사항)
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# 가격/환율/세금 값 저장 타입 (유가 범위에서 float32 정밀도로 충분, 메모리 대역폭 절반)
+PRICE_DTYPE = np.float32
+
+# 캐시 파일에 원래 인덱스를 보존할 컬럼명
+_CACHE_INDEX_COLUMN = '__index__'
+
+# 로더 출력 스키마(dtype/컬럼)가 바뀌면 올려서 이전 Feather 캐시를 무효화
+_CACHE_FORMAT_VERSION = 1
+
+# 한국식 날짜 형식 (09-1218일-01, 2010-0101일-01)
+_KOREAN_DATE_PATTERN = re.compile(r'^(\d{2}|\d{4})-(\d{2})(\d{2})일-\d{2}$')
+_ISO_DATE_PATTERN = r'\d{4}-\d{2}-\d{2}'
+
+
+def _korean_date_to_iso(match: 're.Match') -> str:
+    """한국식 날짜 매치를 YYYY-MM-DD 문자열로 변환"""
+    year, month, day = match.groups()
+    if len(year) == 2:
+        year = f"20{year}"
+    return f"{year}-{month}-{day}"
+
+
+def _move_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """이동평균 (rolling(window).mean()과 동일한 결과, 입력 dtype 유지)"""
+    if len(values) < window:
+        # bottleneck은 창이 길이보다 길면 예외 → rolling과 같이 전부 NaN
+        return np.full(len(values), np.nan, dtype=values.dtype)
+    if BOTTLENECK_AVAILABLE:
+        # float32 입력의 누적합 오차를 막기 위해 float64로 계산 후 되돌림
+        return bn.move_mean(values.astype(np.float64), window=window,
+                            min_count=window).astype(values.dtype, copy=False)
+    return pd.Series(values).rolling(window=window).mean().to_numpy(dtype=values.dtype)
+
+
+def _move_std(values: np.ndarray, window: int) -> np.ndarray:
+    """이동 표준편차 (rolling(window).std()와 동일한 결과, ddof=1)"""
+    if len(values) < window:
+        return np.full(len(values), np.nan, dtype=values.dtype)
+    if BOTTLENECK_AVAILABLE:
+        return bn.move_std(values.astype(np.float64), window=window,
+                           min_count=window, ddof=1).astype(values.dtype, copy=False)
+    return pd.Series(values).rolling(window=window).std().to_numpy(dtype=values.dtype)
+
+
+def _pct_change(values: np.ndarray) -> np.ndarray:
+    """직전 대비 변화율 (첫 값은 NaN, 결측값 채움 없이 입력 dtype 유지)"""
+    out = np.empty_like(values)
+    if len(values) == 0:
+        return out
+    out[0] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(values[1:], values[:-1], out=out[1:])
+    out[1:] -= 1.0
+    return out
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,6 +135,21 @@ class DataLoader:
         self._fuel_tax_data = None
         self._national_data = None
         
+        # 데이터셋별 검증 결과 캐시
+        self._validations: Dict[str, DataValidationResult] = {}
+        
+        # (fuel_type, region) 별 통합 데이터셋 캐시
+        self._integrated_cache: Dict[Tuple[str, Optional[str]], pd.DataFrame] = {}
+        
+        # 로더별 잠금 (병렬 로드 시 중복 파싱 방지)
+        self._load_locks = {
+            name: threading.Lock()
+            for name in ('regional', 'dubai', 'exchange_rate', 'fuel_tax', 'national')
+        }
+        
+        # 스레드별 simdjson 파서 (내부 버퍼 재사용, 병렬 로드 시 공유 불가)
+        self._parser_local = threading.local()
+        
         logger.info(f"DataLoader 초기화 완료: {self.data_path}")
     
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
@@ -58,22 +161,18 @@ class DataLoader:
         """
         logger.info("전체 데이터 로딩 시작...")
         
-        data = {}
-        
-        # 지역별 유가 데이터
-        data['regional'] = self.load_regional_gas_prices()
-        
-        # Dubai 국제유가 데이터
-        data['dubai'] = self.load_dubai_oil_prices()
+        # 서로 독립적인 데이터 소스이므로 동시에 로드
+        tasks = {
+            'regional': self.load_regional_gas_prices,      # 지역별 유가 데이터
+            'dubai': self.load_dubai_oil_prices,            # Dubai 국제유가 데이터
+            'exchange_rate': self.load_exchange_rate,       # 환율 데이터
+            'fuel_tax': self.load_fuel_tax,                 # 유류세 데이터
+            'national': self.load_national_gas_prices       # 전국 평균 유가 데이터
+        }
         
-        # 환율 데이터
-        data['exchange_rate'] = self.load_exchange_rate()
-        
-        # 유류세 데이터
-        data['fuel_tax'] = self.load_fuel_tax()
-        
-        # 전국 평균 유가 데이터
-        data['national'] = self.load_national_gas_prices()
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(loader) for name, loader in tasks.items()}
+            data = {name: future.result() for name, future in futures.items()}
         
         logger.info(f"전체 데이터 로딩 완료: {len(data)}개 데이터셋")
         
@@ -84,212 +183,347 @@ class DataLoader:
         if self._regional_data is not None:
             return self._regional_data
         
-        file_path = self.data_path / self.config.regional_file
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+        with self._load_locks['regional']:
+            if self._regional_data is not None:
+                return self._regional_data
             
-            # 메타데이터 추출
-            metadata = json_data.get('metadata', {})
-            regions = metadata.get('regions', self.config.regions)
-            fuel_types = metadata.get('fuel_types', self.config.fuel_types)
+            file_path = self.data_path / self.config.regional_file
             
-            # 데이터 변환
-            records = []
-            for item in json_data['data']:
-                date = self._parse_date(item['date'])
+            try:
+                df = self._cached('regional', file_path, lambda: self._build_regional_gas_prices(file_path))
+                self._regional_data = df
+                logger.info(f"지역별 유가 데이터 로드 완료: {len(df)} 레코드")
                 
-                for fuel_type in fuel_types:
-                    if fuel_type in item:
-                        for region in regions:
-                            if region in item[fuel_type]:
-                                records.append({
-                                    'date': date,
-                                    'fuel_type': fuel_type,
-                                    'region': region,
-                                    'price': item[fuel_type][region]
-                                })
-            
-            df = pd.DataFrame(records)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values(['date', 'fuel_type', 'region'])
-            
-            # 데이터 검증
-            validation_result = self._validate_data(df, 'regional')
-            if not validation_result.is_valid:
-                logger.warning(f"지역별 데이터 품질 이슈 발견: {validation_result.recommendations}")
+                return df
             
-            self._regional_data = df
-            logger.info(f"지역별 유가 데이터 로드 완료: {len(df)} 레코드")
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"지역별 유가 데이터 로드 실패: {e}")
-            raise
+            except Exception as e:
+                logger.error(f"지역별 유가 데이터 로드 실패: {e}")
+                raise
     
     def load_dubai_oil_prices(self) -> pd.DataFrame:
         """Dubai 국제유가 데이터 로드"""
         if self._dubai_data is not None:
             return self._dubai_data
         
-        file_path = self.data_path / self.config.dubai_file
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            
-            # 데이터 변환
-            records = []
-            for item in json_data['data']:
-                date = self._parse_date(item['date'])
-                records.append({
-                    'date': date,
-                    'dubai_krw_per_liter': item.get('krw_per_liter'),
-                    'dubai_usd_per_barrel': item.get('usd_per_barrel')
-                })
+        with self._load_locks['dubai']:
+            if self._dubai_data is not None:
+                return self._dubai_data
             
-            df = pd.DataFrame(records)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
+            file_path = self.data_path / self.config.dubai_file
             
-            # 결측값 처리
-            df['dubai_krw_per_liter'] = df['dubai_krw_per_liter'].interpolate(method='linear')
-            df['dubai_usd_per_barrel'] = df['dubai_usd_per_barrel'].interpolate(method='linear')
-            
-            self._dubai_data = df
-            logger.info(f"Dubai 유가 데이터 로드 완료: {len(df)} 레코드")
-            
-            return df
+            try:
+                df = self._cached('dubai', file_path, lambda: self._build_dubai_oil_prices(file_path))
+                self._dubai_data = df
+                logger.info(f"Dubai 유가 데이터 로드 완료: {len(df)} 레코드")
+                
+                return df
             
-        except Exception as e:
-            logger.error(f"Dubai 유가 데이터 로드 실패: {e}")
-            raise
+            except Exception as e:
+                logger.error(f"Dubai 유가 데이터 로드 실패: {e}")
+                raise
     
     def load_exchange_rate(self) -> pd.DataFrame:
         """환율 데이터 로드"""
         if self._exchange_rate_data is not None:
             return self._exchange_rate_data
         
-        file_path = self.data_path / self.config.exchange_rate_file
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+        with self._load_locks['exchange_rate']:
+            if self._exchange_rate_data is not None:
+                return self._exchange_rate_data
             
-            # 데이터 변환
-            records = []
-            for item in json_data['data']:
-                date = self._parse_date(item['date'])
-                records.append({
-                    'date': date,
-                    'usd_krw_rate': item.get('rate'),
-                    'exchange_rate_change': item.get('change', 0)
-                })
+            file_path = self.data_path / self.config.exchange_rate_file
             
-            df = pd.DataFrame(records)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-            
-            # 환율 변동성 계산
-            df['exchange_rate_volatility'] = df['usd_krw_rate'].rolling(window=7).std()
-            df['exchange_rate_ma7'] = df['usd_krw_rate'].rolling(window=7).mean()
-            df['exchange_rate_ma30'] = df['usd_krw_rate'].rolling(window=30).mean()
-            
-            self._exchange_rate_data = df
-            logger.info(f"환율 데이터 로드 완료: {len(df)} 레코드")
-            
-            return df
+            try:
+                df = self._cached('exchange_rate', file_path, lambda: self._build_exchange_rate(file_path))
+                self._exchange_rate_data = df
+                logger.info(f"환율 데이터 로드 완료: {len(df)} 레코드")
+                
+                return df
             
-        except Exception as e:
-            logger.error(f"환율 데이터 로드 실패: {e}")
-            raise
+            except Exception as e:
+                logger.error(f"환율 데이터 로드 실패: {e}")
+                raise
     
     def load_fuel_tax(self) -> pd.DataFrame:
         """유류세 데이터 로드"""
         if self._fuel_tax_data is not None:
             return self._fuel_tax_data
         
-        file_path = self.data_path / self.config.fuel_tax_file
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            
-            # 데이터 변환
-            records = []
-            for item in json_data['data']:
-                date = self._parse_date(item['date'])
-                records.append({
-                    'date': date,
-                    'gasoline_tax': item.get('gasoline_tax'),
-                    'diesel_tax': item.get('diesel_tax'),
-                    'tax_change_gasoline': item.get('gasoline_tax_change', 0),
-                    'tax_change_diesel': item.get('diesel_tax_change', 0)
-                })
-            
-            df = pd.DataFrame(records)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-            
-            # 유류세 변화율 계산
-            df['gasoline_tax_pct_change'] = df['gasoline_tax'].pct_change()
-            df['diesel_tax_pct_change'] = df['diesel_tax'].pct_change()
+        with self._load_locks['fuel_tax']:
+            if self._fuel_tax_data is not None:
+                return self._fuel_tax_data
             
-            self._fuel_tax_data = df
-            logger.info(f"유류세 데이터 로드 완료: {len(df)} 레코드")
+            file_path = self.data_path / self.config.fuel_tax_file
             
-            return df
+            try:
+                df = self._cached('fuel_tax', file_path, lambda: self._build_fuel_tax(file_path))
+                self._fuel_tax_data = df
+                logger.info(f"유류세 데이터 로드 완료: {len(df)} 레코드")
+                
+                return df
             
-        except Exception as e:
-            logger.error(f"유류세 데이터 로드 실패: {e}")
-            raise
+            except Exception as e:
+                logger.error(f"유류세 데이터 로드 실패: {e}")
+                raise
     
     def load_national_gas_prices(self) -> pd.DataFrame:
         """전국 평균 유가 데이터 로드"""
         if self._national_data is not None:
             return self._national_data
         
-        file_path = self.data_path / self.config.national_file
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            
-            # 데이터 변환
-            records = []
-            for item in json_data['data']:
-                date = self._parse_date(item['date'])
-                records.append({
-                    'date': date,
-                    'national_gasoline': item.get('gasoline'),
-                    'national_diesel': item.get('diesel'),
-                    'national_kerosene': item.get('kerosene', None),
-                    'national_lpg': item.get('lpg', None)
-                })
-            
-            df = pd.DataFrame(records)
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
+        with self._load_locks['national']:
+            if self._national_data is not None:
+                return self._national_data
             
-            # 전국 평균 변동률 계산
-            df['gasoline_change'] = df['national_gasoline'].pct_change()
-            df['diesel_change'] = df['national_diesel'].pct_change()
+            file_path = self.data_path / self.config.national_file
             
-            # 전국 평균 이동평균
-            for period in [7, 14, 30]:
-                df[f'gasoline_ma{period}'] = df['national_gasoline'].rolling(window=period).mean()
-                df[f'diesel_ma{period}'] = df['national_diesel'].rolling(window=period).mean()
-            
-            self._national_data = df
-            logger.info(f"전국 유가 데이터 로드 완료: {len(df)} 레코드")
-            
-            return df
+            try:
+                df = self._cached('national', file_path, lambda: self._build_national_gas_prices(file_path))
+                self._national_data = df
+                logger.info(f"전국 유가 데이터 로드 완료: {len(df)} 레코드")
+                
+                return df
             
+            except Exception as e:
+                logger.error(f"전국 유가 데이터 로드 실패: {e}")
+                raise
+    
+    def _build_regional_gas_prices(self, file_path: Path) -> pd.DataFrame:
+        """지역별 유가 JSON 파싱 및 검증"""
+        json_data = self._load_json(file_path)
+        
+        # 메타데이터 추출
+        metadata = json_data.get('metadata', {})
+        regions = list(metadata.get('regions', self.config.regions))
+        fuel_types = list(metadata.get('fuel_types', self.config.fuel_types))
+        
+        # 데이터 변환 (레코드 dict 대신 컬럼 배열에 직접 기록)
+        items = json_data['data']
+        capacity = len(items) * len(fuel_types) * len(regions)
+        dates = np.empty(capacity, dtype='datetime64[ns]')
+        fuel_idx = np.empty(capacity, dtype=np.int8)
+        region_idx = np.empty(capacity, dtype=np.int8)
+        prices = np.empty(capacity, dtype=PRICE_DTYPE)
+        
+        parsed_dates = self._parse_dates_bulk([item['date'] for item in items])
+        
+        # 날짜 내에서는 연료/지역을 알파벳순으로 채워 (date, fuel_type, region) 정렬 상태로 생성
+        fuel_order = [(f_code, fuel_types[f_code])
+                      for f_code in np.argsort(fuel_types, kind='stable')]
+        region_order = [(r_code, regions[r_code])
+                        for r_code in np.argsort(regions, kind='stable')]
+        
+        n = 0
+        for date, item in zip(parsed_dates.to_numpy(), items):
+            for f_code, fuel_type in fuel_order:
+                if fuel_type in item:
+                    fuel_prices = item[fuel_type]
+                    for r_code, region in region_order:
+                        if region in fuel_prices:
+                            price = fuel_prices[region]
+                            dates[n] = date
+                            fuel_idx[n] = f_code
+                            region_idx[n] = r_code
+                            prices[n] = np.nan if price is None else price
+                            n += 1
+        
+        # 연료/지역은 반복되는 짧은 문자열이므로 정수 코드 기반 Categorical로 저장
+        df = pd.DataFrame({
+            'date': dates[:n],
+            'fuel_type': self._categorical_from_codes(fuel_idx[:n], fuel_types),
+            'region': self._categorical_from_codes(region_idx[:n], regions),
+            'price': prices[:n]
+        })
+        
+        # 원본 날짜가 중복 없이 오름차순이면 생성 순서가 곧 정렬 순서
+        if not (parsed_dates.is_monotonic_increasing and parsed_dates.is_unique):
+            df = df.sort_values(['date', 'fuel_type', 'region'], kind='mergesort')
+        
+        # 데이터 검증
+        validation_result = self._validate_data(df, 'regional')
+        self._validations['regional'] = validation_result
+        if not validation_result.is_valid:
+            logger.warning(f"지역별 데이터 품질 이슈 발견: {validation_result.recommendations}")
+        
+        return df
+    
+    @staticmethod
+    def _categorical_from_codes(codes: np.ndarray, labels: List[str]) -> pd.Categorical:
+        """
+        라벨 순번 코드를 Categorical로 변환
+        
+        카테고리는 알파벳순으로 두어 정렬 결과가 문자열 컬럼일 때와 같도록 유지
+        """
+        order = np.argsort(labels, kind='stable')
+        rank = np.empty(len(labels), dtype=codes.dtype)
+        rank[order] = np.arange(len(labels))
+        return pd.Categorical.from_codes(rank[codes], categories=[labels[i] for i in order])
+    
+    def _build_dubai_oil_prices(self, file_path: Path) -> pd.DataFrame:
+        """Dubai 유가 JSON 파싱 및 결측값 보간"""
+        json_data = self._load_json(file_path)
+        
+        # 데이터 변환
+        df = self._build_df(json_data['data'], [
+            ('dubai_krw_per_liter', 'krw_per_liter', None),
+            ('dubai_usd_per_barrel', 'usd_per_barrel', None)
+        ])
+        if not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date', kind='mergesort')
+        
+        # 결측값 처리
+        df['dubai_krw_per_liter'] = df['dubai_krw_per_liter'].interpolate(method='linear')
+        df['dubai_usd_per_barrel'] = df['dubai_usd_per_barrel'].interpolate(method='linear')
+        
+        return df
+    
+    def _build_exchange_rate(self, file_path: Path) -> pd.DataFrame:
+        """환율 JSON 파싱 및 변동성 지표 계산"""
+        json_data = self._load_json(file_path)
+        
+        # 데이터 변환
+        df = self._build_df(json_data['data'], [
+            ('usd_krw_rate', 'rate', None),
+            ('exchange_rate_change', 'change', 0.0)
+        ])
+        if not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date', kind='mergesort')
+        
+        # 환율 변동성 계산
+        rate = df['usd_krw_rate'].to_numpy()
+        df['exchange_rate_volatility'] = _move_std(rate, 7)
+        df['exchange_rate_ma7'] = _move_mean(rate, 7)
+        df['exchange_rate_ma30'] = _move_mean(rate, 30)
+        
+        return df
+    
+    def _build_fuel_tax(self, file_path: Path) -> pd.DataFrame:
+        """유류세 JSON 파싱 및 변화율 계산"""
+        json_data = self._load_json(file_path)
+        
+        # 데이터 변환
+        df = self._build_df(json_data['data'], [
+            ('gasoline_tax', 'gasoline_tax', None),
+            ('diesel_tax', 'diesel_tax', None),
+            ('tax_change_gasoline', 'gasoline_tax_change', 0.0),
+            ('tax_change_diesel', 'diesel_tax_change', 0.0)
+        ])
+        if not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date', kind='mergesort')
+        
+        # 유류세 변화율 계산
+        df['gasoline_tax_pct_change'] = _pct_change(df['gasoline_tax'].to_numpy())
+        df['diesel_tax_pct_change'] = _pct_change(df['diesel_tax'].to_numpy())
+        
+        return df
+    
+    def _build_national_gas_prices(self, file_path: Path) -> pd.DataFrame:
+        """전국 평균 유가 JSON 파싱 및 이동평균 계산"""
+        json_data = self._load_json(file_path)
+        
+        # 데이터 변환
+        df = self._build_df(json_data['data'], [
+            ('national_gasoline', 'gasoline', None),
+            ('national_diesel', 'diesel', None),
+            ('national_kerosene', 'kerosene', None),
+            ('national_lpg', 'lpg', None)
+        ])
+        if not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date', kind='mergesort')
+        
+        # 전국 평균 변동률 계산
+        df['gasoline_change'] = _pct_change(df['national_gasoline'].to_numpy())
+        df['diesel_change'] = _pct_change(df['national_diesel'].to_numpy())
+        
+        # 전국 평균 이동평균
+        gasoline = df['national_gasoline'].to_numpy()
+        diesel = df['national_diesel'].to_numpy()
+        for period in [7, 14, 30]:
+            df[f'gasoline_ma{period}'] = _move_mean(gasoline, period)
+            df[f'diesel_ma{period}'] = _move_mean(diesel, period)
+        
+        return df
+    
+    def _build_df(self, items: Any,
+                  field_specs: List[Tuple[str, str, Optional[float]]]) -> pd.DataFrame:
+        """
+        날짜 + 수치 컬럼 DataFrame 생성 (Dubai/환율/유류세/전국 로더 공통)
+        
+        Args:
+            items: JSON 'data' 항목 리스트
+            field_specs: (출력 컬럼명, JSON 키, 키가 없을 때 기본값) 목록. 기본값 None은 NaN
+        """
+        n = len(items)
+        k = len(field_specs)
+        
+        # 키별로 한 번만 순회하며 값을 추출 (키가 없으면 기본값, 값이 None이면 NaN)
+        out = np.empty((n, k), dtype=PRICE_DTYPE, order='F')
+        for j, (_, key, default) in enumerate(field_specs):
+            fill = np.nan if default is None else default
+            out[:, j] = [item.get(key, fill) for item in items]
+        
+        columns = {'date': self._parse_dates_bulk([item['date'] for item in items])}
+        for j, (column, _, _) in enumerate(field_specs):
+            columns[column] = out[:, j]
+        return pd.DataFrame(columns)
+    
+    def _load_json(self, file_path: Path) -> Any:
+        """
+        JSON 파일 로드
+        
+        simdjson 사용 가능 시 파일을 mmap으로 열어 버퍼를 그대로 파싱하고,
+        스레드별 파서를 재사용해 내부 버퍼 재할당을 줄임.
+        없으면 orjson, 그 다음 표준 json 순으로 사용
+        """
+        if not SIMDJSON_AVAILABLE:
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            parser = getattr(self._parser_local, 'parser', None)
+            if parser is None:
+                parser = self._parser_local.parser = simdjson.Parser()
+            try:
+                return parser.parse(buffer)
+            except RuntimeError:
+                # 이전 문서 객체가 아직 참조 중이면 재사용 불가 → 새 파서로 교체
+                parser = self._parser_local.parser = simdjson.Parser()
+                return parser.parse(buffer)
+    
+    def _cached(self, name: str, source_path: Path,
+                builder: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Feather 캐시 경유 로드
+        
+        캐시 파일명은 데이터셋 이름, 원본 파일명, 캐시 형식 버전으로 구성.
+        원본 JSON보다 최신인 캐시가 있으면 JSON 파싱 없이 바로 읽고,
+        없거나 오래된 경우 builder로 다시 만들어 캐시에 기록
+        """
+        if not PYARROW_AVAILABLE:
+            return builder()
+        
+        cache_path = self.data_path / f".{name}.{source_path.stem}.v{_CACHE_FORMAT_VERSION}.feather"
+        if cache_path.exists() and cache_path.stat().st_mtime >= source_path.stat().st_mtime:
+            try:
+                df = pd.read_feather(cache_path)
+                return df.set_index(_CACHE_INDEX_COLUMN).rename_axis(None)
+            except Exception as e:
+                logger.warning(f"캐시 로드 실패, 원본에서 재생성: {cache_path} ({e})")
+        
+        df = builder()
+        try:
+            # Feather는 기본 RangeIndex만 저장하므로 정렬 후 인덱스를 컬럼으로 보존
+            df.reset_index(names=_CACHE_INDEX_COLUMN).to_feather(
+                cache_path, compression='uncompressed'
+            )
         except Exception as e:
-            logger.error(f"전국 유가 데이터 로드 실패: {e}")
-            raise
+            logger.warning(f"캐시 저장 실패: {cache_path} ({e})")
+        
+        return df
     
     def get_integrated_dataset(self, 
                              fuel_type: str = 'gasoline',
@@ -304,6 +538,10 @@ class DataLoader:
         Returns:
             통합된 데이터프레임
         """
+        cache_key = (fuel_type, region)
+        if cache_key in self._integrated_cache:
+            return self._integrated_cache[cache_key]
+        
         logger.info(f"통합 데이터셋 생성 시작: {fuel_type}, {region}")
         
         # 모든 데이터 로드
@@ -321,53 +559,66 @@ class DataLoader:
             # 전국 평균 데이터
             base_df = data['national'][['date', f'national_{fuel_type}']].copy()
         
-        # Dubai 유가 데이터 병합
-        base_df = pd.merge(base_df, data['dubai'], on='date', how='left')
-        
-        # 환율 데이터 병합
-        base_df = pd.merge(base_df, data['exchange_rate'], on='date', how='left')
-        
-        # 유류세 데이터 병합
-        base_df = pd.merge(base_df, data['fuel_tax'], on='date', how='left')
+        # Dubai 유가, 환율, 유류세 데이터를 날짜 인덱스 기준으로 한 번에 병합
+        base_df = base_df.set_index('date').join(
+            [data['dubai'].set_index('date'),
+             data['exchange_rate'].set_index('date'),
+             data['fuel_tax'].set_index('date')],
+            how='left'
+        ).reset_index()
         
         # 날짜 순 정렬
         base_df = base_df.sort_values('date').reset_index(drop=True)
         
-        # 결측값 처리
-        base_df = base_df.fillna(method='forward').fillna(method='backward')
+        # 결측값 처리 (수치 컬럼을 float32로 맞춰 타입별 고속 fill 경로 사용)
+        num_cols = base_df.select_dtypes(include='number').columns
+        base_df[num_cols] = base_df[num_cols].astype('float32')
+        base_df = base_df.ffill().bfill()
         
         logger.info(f"통합 데이터셋 생성 완료: {len(base_df)} 레코드, {len(base_df.columns)} 컬럼")
         
+        self._integrated_cache[cache_key] = base_df
         return base_df
     
-    def _parse_date(self, date_str: str) -> datetime:
-        """다양한 날짜 형식 파싱"""
-        try:
-            # 표준 ISO 형식
-            if '-' in date_str and len(date_str) == 10:
-                return datetime.strptime(date_str, '%Y-%m-%d')
-            
-            # 한국식 형식 (09-1218일-01)
-            if '일' in date_str:
-                # 복잡한 한국식 날짜 파싱 로직
-                parts = date_str.replace('일', '').split('-')
-                if len(parts) == 3:
-                    year = f"20{parts[0]}"
-                    month_day = parts[1]
-                    if len(month_day) == 4:  # MMDD
-                        month = month_day[:2]
-                        day = month_day[2:]
-                    else:
-                        month = "01"
-                        day = "01"
-                    return datetime(int(year), int(month), int(day))
-            
-            # 기본 파싱 시도
-            return pd.to_datetime(date_str).to_pydatetime()
-            
-        except Exception as e:
-            logger.warning(f"날짜 파싱 실패: {date_str}, 기본값 사용")
-            return datetime.now()
+    def invalidate_cache(self):
+        """원본 데이터가 변경되었을 때 메모리 캐시 초기화"""
+        self._integrated_cache.clear()
+        self._validations.clear()
+        self._regional_data = None
+        self._dubai_data = None
+        self._exchange_rate_data = None
+        self._fuel_tax_data = None
+        self._national_data = None
+        logger.info("DataLoader 캐시 초기화 완료")
+    
+    def _parse_dates_bulk(self, date_strs: List[str]) -> pd.DatetimeIndex:
+        """
+        다양한 날짜 형식 일괄 파싱
+        
+        한국식 형식(09-1218일-01)을 정규식으로 ISO 형식으로 정규화한 뒤
+        고정 포맷으로 한 번에 변환하고, 나머지 형식만 범용 파서로 처리
+        """
+        date_series = pd.Series(date_strs, dtype=object).astype(str)
+        normalized = date_series.str.replace(_KOREAN_DATE_PATTERN, _korean_date_to_iso, regex=True)
+        
+        # 표준 ISO 형식 (한국식 정규화 결과 포함)
+        iso_mask = normalized.str.fullmatch(_ISO_DATE_PATTERN)
+        parsed = pd.to_datetime(normalized.where(iso_mask), format='%Y-%m-%d',
+                                errors='coerce', cache=True)
+        
+        # 기본 파싱 시도
+        other_mask = ~iso_mask
+        if other_mask.any():
+            parsed[other_mask] = pd.to_datetime(normalized[other_mask], format='mixed',
+                                                errors='coerce')
+        
+        failed = parsed.isna()
+        if failed.any():
+            logger.warning(f"날짜 파싱 실패 {int(failed.sum())}건: "
+                           f"{date_series[failed].head(5).tolist()}, 기본값 사용")
+            parsed[failed] = pd.Timestamp(datetime.now())
+        
+        return pd.DatetimeIndex(parsed)
     
     def _validate_data(self, df: pd.DataFrame, data_type: str) -> DataValidationResult:
         """데이터 품질 검증"""
@@ -377,37 +628,47 @@ class DataLoader:
         
         # 기본 통계
         total_records = len(df)
-        missing_values = df.isnull().sum().sum()
+        numeric_values = df.select_dtypes(include='number').to_numpy(dtype=np.float64, na_value=np.nan)
+        missing_values = int(np.isnan(numeric_values).sum())
+        missing_values += int(df.select_dtypes(exclude='number').isna().to_numpy().sum())
         
         # 날짜 연속성 검증
         if 'date' in df.columns:
             date_range = pd.date_range(start=df['date'].min(), end=df['date'].max())
-            missing_dates = [d.strftime('%Y-%m-%d') for d in date_range 
-                           if d not in df['date'].values]
+            missing_dates = date_range.difference(df['date']).strftime('%Y-%m-%d').tolist()
         
         # 가격 데이터 이상치 검증 (석유업계 경험 기반)
         price_columns = [col for col in df.columns if 'price' in col or 'tax' in col]
-        for col in price_columns:
-            if col in df.columns:
-                q1 = df[col].quantile(0.25)
-                q3 = df[col].quantile(0.75)
-                iqr = q3 - q1
-                lower_bound = q1 - 1.5 * iqr
-                upper_bound = q3 + 1.5 * iqr
-                
-                outlier_mask = (df[col] < lower_bound) | (df[col] > upper_bound)
-                outlier_indices = df[outlier_mask].index.tolist()
-                
-                if len(outlier_indices) > 0:
-                    outliers.extend([
-                        {
-                            'column': col,
-                            'index': idx,
-                            'value': df.loc[idx, col],
-                            'date': df.loc[idx, 'date'] if 'date' in df.columns else None
-                        }
-                        for idx in outlier_indices[:10]  # 처음 10개만
-                    ])
+        if price_columns:
+            values = df[price_columns].to_numpy(dtype=np.float64)
+            with warnings.catch_warnings():
+                # 전부 결측인 컬럼은 NaN 경계가 되어 이상치 없음으로 처리
+                warnings.simplefilter('ignore', RuntimeWarning)
+                q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+            iqr = q3 - q1
+            lower_bound = q1 - 1.5 * iqr
+            upper_bound = q3 + 1.5 * iqr
+            outlier_mask = (values < lower_bound) | (values > upper_bound)
+            
+            # 컬럼 우선 순서로 이상치 위치를 한 번에 구하고 컬럼별 처음 10개만 유지
+            col_idx, row_idx = np.nonzero(outlier_mask.T)
+            rank = np.arange(len(col_idx)) - np.searchsorted(col_idx, col_idx)
+            keep = rank < 10
+            col_idx, row_idx = col_idx[keep], row_idx[keep]
+            
+            # 라벨/값/날짜를 위치 기반으로 일괄 추출 (이상치별 df.loc 조회 없음)
+            labels = df.index[row_idx].tolist()
+            outlier_values = values[row_idx, col_idx]
+            dates = df['date'].array[row_idx] if 'date' in df.columns else [None] * len(row_idx)
+            outliers.extend([
+                {
+                    'column': price_columns[c],
+                    'index': idx,
+                    'value': value,
+                    'date': date
+                }
+                for c, idx, value, date in zip(col_idx, labels, outlier_values, dates)
+            ])
         
         # 데이터 품질 점수 계산
         quality_score = max(0, 1 - (missing_values / total_records) - (len(outliers) / total_records))
@@ -428,6 +689,14 @@ class DataLoader:
             recommendations=recommendations
         )
     
+    def _get_validation(self, key: str, df: pd.DataFrame) -> DataValidationResult:
+        """로드 시 계산된 검증 결과 반환 (없으면 계산 후 저장)"""
+        validation_result = self._validations.get(key)
+        if validation_result is None:
+            validation_result = self._validate_data(df, key)
+            self._validations[key] = validation_result
+        return validation_result
+    
     def get_data_info(self) -> Dict[str, Any]:
         """데이터 정보 요약"""
         data = self.load_all_data()
@@ -442,7 +711,7 @@ class DataLoader:
                     'end': df['date'].max().isoformat() if 'date' in df.columns else None
                 },
                 'missing_values': df.isnull().sum().sum(),
-                'data_quality': self._validate_data(df, key).data_quality_score
+                'data_quality': self._get_validation(key, df).data_quality_score
             }
         
         return info
\ No newline at end of file
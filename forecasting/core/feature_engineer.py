@@ -3,21 +3,131 @@ Feature Engineering for Oil Price Forecasting
 Advanced feature extraction with petroleum industry expertise
 """
 
+import copy
+import hashlib
+import json
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, Union
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
+from sklearn.exceptions import NotFittedError
 from scipy import stats
 import holidays
 import logging
 from dataclasses import dataclass
 
 from ..config.model_config import FeatureConfig
+from .._numba import NUMBA_AVAILABLE
+from ._rolling_kernels import macd_kernel, roll_mean_std_min_max, rsi_wilder
+
+# Parquet 결과 캐시 (pyarrow, 선택사항)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 대용량 입력용 지연 실행 경로 (polars, 선택사항)
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# 메모리에 보관할 특징 엔지니어링 결과 수
+_MEMORY_CACHE_SIZE = 8
+
+# 특징 정의가 바뀌면 올려서 이전 디스크 캐시(cache_dir)를 무효화
+_CACHE_FORMAT_VERSION = 1
+
+# 특징 중요도(상관) 추정에 사용할 최대 행 수와 상수 컬럼 판정 기준
+_IMPORTANCE_MAX_ROWS = 50_000
+_IMPORTANCE_MIN_STD = 1e-8
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """Series를 실수형 NumPy 배열로 변환 (실수형이면 복사 없이 반환)"""
+    values = series.to_numpy()
+    if values.dtype.kind != 'f':
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values
+
+
+def _shift_values(values: np.ndarray, lag: int) -> np.ndarray:
+    """Series.shift(lag)와 같은 결과를 슬라이스 복사 한 번으로 생성"""
+    out = np.empty_like(values)
+    if lag == 0:
+        out[:] = values
+        return out
+    out[:lag] = np.nan
+    out[lag:] = values[:-lag]
+    return out
+
+
+def _diff_values(values: np.ndarray, lag: int) -> np.ndarray:
+    """Series.diff(lag)와 같은 결과를 슬라이스 연산 한 번으로 생성"""
+    out = np.empty_like(values)
+    out[:lag] = np.nan
+    np.subtract(values[lag:], values[:-lag], out=out[lag:])
+    return out
+
+
+def _pct_values(values: np.ndarray, lag: int) -> np.ndarray:
+    """Series.pct_change(lag)와 같은 변화율을 슬라이스 연산으로 생성 (분모가 0이면 NaN)"""
+    out = np.full_like(values, np.nan)
+    denom = values[:-lag]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(values[lag:], denom, out=out[lag:], where=denom != 0)
+    out[lag:] -= 1
+    return out
+
+
+def _pl_pct(expr: Any, lag: int) -> Any:
+    """_pct_values와 같은 변화율 Polars 표현식 (분모가 0이면 null)"""
+    previous = expr.shift(lag)
+    return pl.when(previous != 0).then(expr / previous - 1)
+
+
+def _iso_week_values(index: pd.DatetimeIndex, dayofweek: np.ndarray) -> np.ndarray:
+    """
+    ISO 주차를 날짜 산술로 계산 (isocalendar().week와 동일)
+    
+    ISO 주차는 해당 주 목요일이 속한 해를 기준으로 하므로 목요일로 옮긴 뒤
+    그 해 1월 1일부터의 경과 일수를 7로 나눔
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    days = index.to_numpy().astype('datetime64[D]')
+    thursday = days + (3 - dayofweek.astype(np.int64)).astype('timedelta64[D]')
+    year_start = thursday.astype('datetime64[Y]').astype('datetime64[D]')
+    return ((thursday - year_start).astype(np.int64) // 7 + 1).astype(np.int8)
+
+
+# 계절 코드 → 원-핫 컬럼 이름
+SEASON_FLAGS = {0: 'is_winter', 1: 'is_spring', 2: 'is_summer', 3: 'is_autumn'}
+
+
+def season_onehot(df: pd.DataFrame, column: str = 'season') -> pd.DataFrame:
+    """
+    계절 코드 컬럼을 is_winter/is_spring/is_summer/is_autumn int8 플래그로 확장
+    
+    원-핫 입력이 필요한 모델의 학습 시점에만 호출 (계절 컬럼이 없으면 그대로 반환)
+    """
+    if column not in df.columns:
+        return df
+    
+    season = df[column].to_numpy()
+    flags = {name: (season == code).astype(np.int8) for code, name in SEASON_FLAGS.items()}
+    return pd.concat([df.drop(columns=column), pd.DataFrame(flags, index=df.index)], axis=1)
+
+
 @dataclass
 class FeatureEngineeringResult:
     """특징 엔지니어링 결과"""
@@ -36,19 +146,24 @@ class FeatureEngineer:
     - 기술적 지표 특징
     """
     
-    def __init__(self, config: FeatureConfig):
+    def __init__(self, config: FeatureConfig,
+                 cache_dir: Optional[Union[str, Path]] = None):
         self.config = config
-        self.feature_categories = {
-            'time_series': [],
-            'seasonal': [],
-            'external': [],
-            'regional': [],
-            'technical': [],
-            'interaction': []
-        }
+        # 결과 캐시: 메모리 LRU + (cache_dir 지정 시) 디스크 parquet
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._mem_cache: 'OrderedDict[str, FeatureEngineeringResult]' = OrderedDict()
+        # 상호작용 특징에 쓰는 컬럼 목록 (생성 시점에 분류해 컬럼 전체 재탐색 방지)
+        self._col_index: Dict[str, List[str]] = {'oil': [], 'exchange': [], 'volatility': []}
+        self._reset_feature_categories()
+        
+        # fit() 결과 (transform() 시 재사용)
+        self.is_fitted = False
+        self._selected_features: List[str] = []
+        self._feature_categories_frozen: Dict[str, List[str]] = {}
         
         # 한국 휴일 정보
         self.korean_holidays = holidays.SouthKorea(years=range(2010, 2030))
+        self._holiday_days = self._build_holiday_days()
         
         logger.info("FeatureEngineer 초기화 완료")
     
@@ -68,7 +183,118 @@ class FeatureEngineer:
         """
         logger.info(f"특징 엔지니어링 시작: {target_column}")
         
+        cache_key = self._cache_key(df, target_column, external_columns)
+        cached = self._load_cached_result(cache_key)
+        if cached is not None:
+            logger.info(f"특징 엔지니어링 캐시 사용: {cache_key}")
+            self.feature_categories = copy.deepcopy(cached.feature_categories)
+            return cached
+        
+        # 1~6. 특징 생성
+        feature_df = self._build_feature_frame(df, target_column, external_columns)
+        
+        # 7. 특징 중요도 계산
+        feature_importance = self._calculate_feature_importance(feature_df, target_column)
+        
+        # 8. 특징 선택
+        selected_features = self._select_features(feature_df, target_column, feature_importance)
+        feature_df = self._subset_features(feature_df, selected_features, target_column)
+        
+        logger.info(f"특징 엔지니어링 완료: {len(feature_df.columns)-1}개 특징 생성")
+        
+        engineering_summary = {
+            'total_features': len(feature_df.columns) - 1,
+            'feature_categories': {k: len(v) for k, v in self.feature_categories.items()},
+            'date_range': {
+                'start': feature_df.index.min().isoformat(),
+                'end': feature_df.index.max().isoformat()
+            }
+        }
+        
+        result = FeatureEngineeringResult(
+            feature_data=feature_df,
+            feature_importance=feature_importance,
+            feature_categories=self.feature_categories,
+            engineering_summary=engineering_summary
+        )
+        self._store_cached_result(cache_key, result)
+        
+        return result
+    
+    def fit(self, df: pd.DataFrame,
+            target_column: str,
+            external_columns: Optional[List[str]] = None) -> 'FeatureEngineer':
+        """
+        특징 생성·선택을 수행하고 선택된 특징 목록을 고정
+        
+        Args:
+            df: 학습 데이터프레임
+            target_column: 예측 대상 컬럼
+            external_columns: 외부 요인 컬럼들
+        
+        Returns:
+            self
+        """
+        self.fit_transform(df, target_column, external_columns)
+        return self
+    
+    def fit_transform(self, df: pd.DataFrame,
+                      target_column: str,
+                      external_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """fit() 후 학습 데이터의 특징 데이터프레임 반환"""
+        result = self.create_features(df, target_column, external_columns)
+        
+        self._selected_features = [col for col in result.feature_data.columns if col != target_column]
+        self._feature_categories_frozen = copy.deepcopy(result.feature_categories)
+        self.is_fitted = True
+        
+        return result.feature_data
+    
+    def transform(self, df: pd.DataFrame,
+                  target_column: str,
+                  external_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        fit()에서 고정한 특징만 생성 (중요도 계산·특징 선택 생략)
+        
+        Args:
+            df: 예측용 데이터프레임
+            target_column: 예측 대상 컬럼 (lag 등 특징 생성에 사용)
+            external_columns: 외부 요인 컬럼들
+        
+        Returns:
+            fit() 때와 같은 순서의 특징 컬럼 + 대상 컬럼
+        """
+        if not self.is_fitted:
+            raise NotFittedError("특징 엔지니어가 학습되지 않았습니다. fit() 메서드를 먼저 호출하세요.")
+        
+        feature_df = self._build_feature_frame(df, target_column, external_columns)
+        self.feature_categories = copy.deepcopy(self._feature_categories_frozen)
+        
+        missing = [col for col in self._selected_features if col not in feature_df.columns]
+        if missing:
+            raise ValueError(f"학습 시 선택된 특징을 생성할 수 없습니다: {missing}")
+        
+        return self._subset_features(feature_df, self._selected_features, target_column)
+    
+    def _reset_feature_categories(self):
+        """특징 분류 목록 초기화 (호출마다 새로 구성)"""
+        self.feature_categories = {
+            'time_series': [],
+            'seasonal': [],
+            'external': [],
+            'regional': [],
+            'technical': [],
+            'interaction': []
+        }
+    
+    def _build_feature_frame(self, df: pd.DataFrame,
+                             target_column: str,
+                             external_columns: Optional[List[str]]) -> pd.DataFrame:
+        """특징 생성 단계 1~6 실행 (중요도 계산·선택 전 전체 특징)"""
+        # 입력 보호용 복사는 여기서 한 번만 수행 (이후 단계는 이 프레임을 직접 수정)
         feature_df = df.copy()
+        self._reset_feature_categories()
+        self._reset_col_index(feature_df.columns)
         
         # 1. 시계열 기반 특징
         feature_df = self._create_time_series_features(feature_df, target_column)
@@ -90,21 +316,177 @@ class FeatureEngineer:
         # 6. 상호작용 특징
         feature_df = self._create_interaction_features(feature_df, target_column)
         
+        return feature_df
+    
+    def _subset_features(self, feature_df: pd.DataFrame,
+                         selected_features: List[str],
+                         target_column: str) -> pd.DataFrame:
+        """선택된 특징 + 대상 컬럼만 남기고 실수형 특징은 float32로 변환"""
+        feature_df = feature_df[selected_features + [target_column]]
+        
+        # 선택된 특징은 float32로 저장해 이후 학습 단계의 메모리 대역폭 절감 (타깃은 원래 dtype 유지)
+        float_columns = [col for col in feature_df.select_dtypes(include='float64').columns
+                         if col != target_column]
+        if float_columns:
+            feature_df = feature_df.astype(dict.fromkeys(float_columns, np.float32))
+        
+        return feature_df
+    
+    def _cache_key(self, df: pd.DataFrame, target_column: str,
+                   external_columns: Optional[List[str]]) -> str:
+        """캐시 형식 버전, 입력 데이터(인덱스·컬럼 포함), 대상 컬럼, 설정, 외부 컬럼으로 캐시 키 생성"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"v{_CACHE_FORMAT_VERSION}".encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        digest.update(repr(list(df.columns)).encode())
+        digest.update(target_column.encode())
+        digest.update(repr(self.config).encode())
+        digest.update(repr(external_columns).encode())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _copy_result(result: FeatureEngineeringResult) -> FeatureEngineeringResult:
+        """캐시된 결과가 호출 측 수정에 영향받지 않도록 복사"""
+        return FeatureEngineeringResult(
+            feature_data=result.feature_data.copy(),
+            feature_importance=dict(result.feature_importance),
+            feature_categories=copy.deepcopy(result.feature_categories),
+            engineering_summary=copy.deepcopy(result.engineering_summary)
+        )
+    
+    def _cache_paths(self, key: str) -> Tuple[Path, Path]:
+        """디스크 캐시의 특징 데이터(parquet)와 메타데이터(json) 경로"""
+        return self.cache_dir / f"{key}.parquet", self.cache_dir / f"{key}.json"
+    
+    def _load_cached_result(self, key: str) -> Optional[FeatureEngineeringResult]:
+        """메모리 → 디스크 순으로 캐시된 결과 조회 (없으면 None)"""
+        if key in self._mem_cache:
+            self._mem_cache.move_to_end(key)
+            return self._copy_result(self._mem_cache[key])
+        
+        if self.cache_dir is None or not PYARROW_AVAILABLE:
+            return None
+        
+        data_path, meta_path = self._cache_paths(key)
+        if not (data_path.exists() and meta_path.exists()):
+            return None
+        
+        try:
+            feature_df = pd.read_parquet(data_path)
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            result = FeatureEngineeringResult(
+                feature_data=feature_df,
+                feature_importance=meta['feature_importance'],
+                feature_categories=meta['feature_categories'],
+                engineering_summary=meta['engineering_summary']
+            )
+        except Exception as e:
+            logger.warning(f"특징 캐시 로드 실패, 다시 계산: {data_path} ({e})")
+            return None
+        
+        self._remember(key, result)
+        return self._copy_result(result)
+    
+    def _store_cached_result(self, key: str, result: FeatureEngineeringResult):
+        """결과를 메모리 캐시와 (가능하면) 디스크 캐시에 기록"""
+        self._remember(key, self._copy_result(result))
+        
+        if self.cache_dir is None or not PYARROW_AVAILABLE:
+            return
+        
+        data_path, meta_path = self._cache_paths(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            result.feature_data.to_parquet(data_path, compression='zstd')
+            meta = {
+                'feature_importance': {k: float(v) for k, v in result.feature_importance.items()},
+                'feature_categories': result.feature_categories,
+                'engineering_summary': result.engineering_summary
+            }
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, default=float)
+        except Exception as e:
+            logger.warning(f"특징 캐시 저장 실패: {data_path} ({e})")
+    
+    def _remember(self, key: str, result: FeatureEngineeringResult):
+        """메모리 LRU 캐시에 추가 (최대 _MEMORY_CACHE_SIZE개 유지)"""
+        self._mem_cache[key] = result
+        self._mem_cache.move_to_end(key)
+        while len(self._mem_cache) > _MEMORY_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
+    
+    def create_features_polars(self, data: Any,
+                               target_column: str,
+                               external_columns: Optional[List[str]] = None,
+                               date_column: str = 'date') -> FeatureEngineeringResult:
+        """
+        Polars LazyFrame 기반 특징 엔지니어링 파이프라인 (대용량 입력용)
+        
+        create_features와 같은 특징을 하나의 지연 실행 계획으로 구성해 한 번에 계산.
+        인덱스 대신 date_column을 날짜 기준으로 사용하며, feature_data는
+        Polars DataFrame(date_column + 선택 특징 + 대상 컬럼)으로 반환
+        
+        Args:
+            data: 입력 데이터 (pl.DataFrame 또는 pl.LazyFrame)
+            target_column: 예측 대상 컬럼
+            external_columns: 외부 요인 컬럼들
+            date_column: 날짜 컬럼
+        
+        Returns:
+            FeatureEngineeringResult
+        """
+        if not POLARS_AVAILABLE:
+            raise ImportError("create_features_polars를 사용하려면 polars가 필요합니다")
+        
+        logger.info(f"특징 엔지니어링 시작 (polars): {target_column}")
+        
+        lf = data.lazy() if isinstance(data, pl.DataFrame) else data
+        input_columns = lf.collect_schema().names()
+        if date_column not in input_columns:
+            raise ValueError(f"날짜 컬럼이 없습니다: {date_column}")
+        
+        lf = lf.sort(date_column)
+        self._reset_feature_categories()
+        self._reset_col_index([col for col in input_columns if col != date_column])
+        
+        # 1~4. 시계열/계절성/외부 요인/기술적 지표 특징 (서로 독립이므로 한 번에 추가)
+        exprs = self._polars_time_series_exprs(target_column)
+        exprs += self._polars_seasonal_exprs(lf, date_column)
+        if external_columns:
+            exprs += self._polars_external_exprs(external_columns, input_columns)
+        exprs += self._polars_technical_exprs(target_column)
+        lf = lf.with_columns(exprs)
+        
+        # 5. 지역별 특성 특징은 pandas 경로와 마찬가지로 아직 생성하지 않음
+        
+        # 6. 상호작용 특징 (앞 단계 컬럼 사용)
+        interaction_exprs = self._polars_interaction_exprs(lf.collect_schema().names())
+        if interaction_exprs:
+            lf = lf.with_columns(interaction_exprs)
+        
+        feature_df = lf.collect()
+        
         # 7. 특징 중요도 계산
-        feature_importance = self._calculate_feature_importance(feature_df, target_column)
+        feature_importance = self._calculate_feature_importance_polars(
+            feature_df, target_column, date_column
+        )
         
-        # 8. 특징 선택
+        # 8. 특징 선택 (선택된 실수형 특징은 float32로 저장)
         selected_features = self._select_features(feature_df, target_column, feature_importance)
-        feature_df = feature_df[selected_features + [target_column]]
+        feature_df = feature_df.select([date_column] + selected_features + [target_column])
+        float_columns = [col for col in selected_features if feature_df.schema[col] == pl.Float64]
+        if float_columns:
+            feature_df = feature_df.with_columns(pl.col(float_columns).cast(pl.Float32))
         
-        logger.info(f"특징 엔지니어링 완료: {len(feature_df.columns)-1}개 특징 생성")
+        logger.info(f"특징 엔지니어링 완료 (polars): {len(selected_features)}개 특징 생성")
         
         engineering_summary = {
-            'total_features': len(feature_df.columns) - 1,
+            'total_features': len(selected_features),
             'feature_categories': {k: len(v) for k, v in self.feature_categories.items()},
             'date_range': {
-                'start': feature_df.index.min().isoformat(),
-                'end': feature_df.index.max().isoformat()
+                'start': feature_df[date_column].min().isoformat(),
+                'end': feature_df[date_column].max().isoformat()
             }
         }
         
@@ -115,259 +497,496 @@ class FeatureEngineer:
             engineering_summary=engineering_summary
         )
     
-    def _create_time_series_features(self, df: pd.DataFrame, 
-                                   target_column: str) -> pd.DataFrame:
-        """시계열 기반 특징 생성"""
-        logger.info("시계열 특징 생성...")
-        
-        feature_df = df.copy()
+    def _register_polars_exprs(self, category: str, exprs: List[Any]) -> List[Any]:
+        """생성할 Polars 표현식의 컬럼 이름을 특징 분류와 상호작용용 목록에 등록"""
+        names = [expr.meta.output_name() for expr in exprs]
+        self.feature_categories[category].extend(names)
+        if category in ('time_series', 'external'):
+            self._index_columns(names)
+        return exprs
+    
+    def _polars_time_series_exprs(self, target_column: str) -> List[Any]:
+        """시계열 기반 특징 (Polars 표현식)"""
+        target = pl.col(target_column).cast(pl.Float64)
+        exprs = []
         
         # Lag 특징
         for lag in self.config.lag_features:
-            col_name = f'{target_column}_lag_{lag}'
-            feature_df[col_name] = feature_df[target_column].shift(lag)
-            self.feature_categories['time_series'].append(col_name)
+            exprs.append(target.shift(lag).alias(f'{target_column}_lag_{lag}'))
         
         # Rolling 통계 특징
         for window in self.config.rolling_features:
-            # Rolling mean
-            col_name = f'{target_column}_ma_{window}'
-            feature_df[col_name] = feature_df[target_column].rolling(window=window).mean()
-            self.feature_categories['time_series'].append(col_name)
+            exprs += [
+                target.rolling_mean(window).alias(f'{target_column}_ma_{window}'),
+                target.rolling_std(window).alias(f'{target_column}_std_{window}'),
+                target.rolling_min(window).alias(f'{target_column}_min_{window}'),
+                target.rolling_max(window).alias(f'{target_column}_max_{window}'),
+                target.rolling_median(window).alias(f'{target_column}_median_{window}')
+            ]
+        
+        # Difference 특징
+        for diff_lag in self.config.diff_features:
+            exprs.append(target.diff(diff_lag).alias(f'{target_column}_diff_{diff_lag}'))
+            exprs.append(_pl_pct(target, diff_lag).alias(f'{target_column}_pct_change_{diff_lag}'))
+        
+        # 변동성 특징 (같은 창의 rolling 표현식은 공통 부분식 제거로 한 번만 계산)
+        for window in [7, 14, 30]:
+            roll_mean = target.rolling_mean(window)
+            exprs.append(
+                pl.when(roll_mean != 0).then(target.rolling_std(window) / roll_mean)
+                .alias(f'{target_column}_volatility_{window}')
+            )
+        
+        return self._register_polars_exprs('time_series', exprs)
+    
+    def _polars_seasonal_exprs(self, lf: Any, date_column: str) -> List[Any]:
+        """계절성 및 달력 특징 (Polars 표현식)"""
+        date = pl.col(date_column)
+        month = date.dt.month().cast(pl.Int8)
+        dayofweek = (date.dt.weekday() - 1).cast(pl.Int8)  # 월요일=0
+        dayofyear = date.dt.ordinal_day().cast(pl.Int16)
+        two_pi = pl.lit(2 * np.pi, dtype=pl.Float32)
+        
+        exprs = [
+            date.dt.year().cast(pl.Int16).alias('year'),
+            month.alias('month'),
+            date.dt.day().cast(pl.Int8).alias('day'),
+            dayofweek.alias('dayofweek'),
+            dayofyear.alias('dayofyear'),
+            date.dt.week().cast(pl.Int8).alias('week'),
+            date.dt.quarter().cast(pl.Int8).alias('quarter'),
+            
+            # 순환적 특징 (월, 요일 등)
+            (two_pi * month.cast(pl.Float32) / 12).sin().alias('month_sin'),
+            (two_pi * month.cast(pl.Float32) / 12).cos().alias('month_cos'),
+            (two_pi * dayofweek.cast(pl.Float32) / 7).sin().alias('dayofweek_sin'),
+            (two_pi * dayofweek.cast(pl.Float32) / 7).cos().alias('dayofweek_cos'),
+            (two_pi * dayofyear.cast(pl.Float32) / 365).sin().alias('dayofyear_sin'),
+            (two_pi * dayofyear.cast(pl.Float32) / 365).cos().alias('dayofyear_cos'),
+            
+            # 계절 코드 0=겨울, 1=봄, 2=여름, 3=가을
+            ((month % 12) // 3).cast(pl.Int8).alias('season')
+        ]
+        
+        # 휴일 특징
+        if self.config.holiday_features:
+            year_range = lf.select(
+                date.dt.year().min().alias('first'), date.dt.year().max().alias('last')
+            ).collect()
+            if year_range['first'][0] is not None:
+                self._ensure_holiday_years(int(year_range['first'][0]), int(year_range['last'][0]))
             
-            # Rolling std
-            col_name = f'{target_column}_std_{window}'
-            feature_df[col_name] = feature_df[target_column].rolling(window=window).std()
-            self.feature_categories['time_series'].append(col_name)
+            days = date.cast(pl.Date).cast(pl.Int64)
+            exprs += [
+                days.is_in(self._holiday_days.tolist()).cast(pl.Int8).alias('is_holiday'),
+                (dayofweek >= 5).cast(pl.Int8).alias('is_weekend'),
+                
+                # 휴일 전후 효과
+                days.map_batches(
+                    lambda s: pl.Series(self._days_to_holiday_values(s.to_numpy())),
+                    return_dtype=pl.Int64
+                ).alias('days_to_holiday'),
+                days.map_batches(
+                    lambda s: pl.Series(self._days_after_holiday_values(s.to_numpy())),
+                    return_dtype=pl.Int64
+                ).alias('days_after_holiday')
+            ]
+        
+        return self._register_polars_exprs('seasonal', exprs)
+    
+    def _polars_external_exprs(self, external_columns: List[str],
+                               input_columns: List[str]) -> List[Any]:
+        """외부 요인 특징 (Polars 표현식)"""
+        exprs = []
+        for col in external_columns:
+            if col not in input_columns:
+                continue
+            
+            series = pl.col(col).cast(pl.Float64)
+            
+            # 기본 lag 특징
+            for lag in self._external_lags(col):
+                if lag == 0:
+                    continue
+                exprs.append(series.shift(lag).alias(f'{col}_lag_{lag}'))
             
-            # Rolling min/max
-            col_name = f'{target_column}_min_{window}'
-            feature_df[col_name] = feature_df[target_column].rolling(window=window).min()
-            self.feature_categories['time_series'].append(col_name)
+            # Rolling 통계
+            for window in [7, 14, 30]:
+                exprs.append(series.rolling_mean(window).alias(f'{col}_ma_{window}'))
+                exprs.append(series.rolling_std(window).alias(f'{col}_std_{window}'))
             
-            col_name = f'{target_column}_max_{window}'
-            feature_df[col_name] = feature_df[target_column].rolling(window=window).max()
-            self.feature_categories['time_series'].append(col_name)
+            # 변화율 특징
+            exprs.append(_pl_pct(series, 1).alias(f'{col}_pct_change'))
+            exprs.append(_pl_pct(series, 7).alias(f'{col}_pct_change_7d'))
+        
+        return self._register_polars_exprs('external', exprs)
+    
+    def _polars_technical_exprs(self, target_column: str) -> List[Any]:
+        """기술적 지표 특징 (Polars 표현식)"""
+        price = pl.col(target_column).cast(pl.Float64)
+        
+        # MACD (ewm adjust=True로 pandas 경로와 동일)
+        macd = price.ewm_mean(span=12, adjust=True) - price.ewm_mean(span=26, adjust=True)
+        macd_signal = macd.ewm_mean(span=9, adjust=True)
+        
+        # Bollinger Bands
+        sma20 = price.rolling_mean(20)
+        std20 = price.rolling_std(20)
+        bb_upper = sma20 + 2 * std20
+        bb_lower = sma20 - 2 * std20
+        bb_width = 4 * std20  # 상단 - 하단
+        
+        exprs = [
+            # RSI (Wilder 평활, pandas 경로와 같은 커널 사용)
+            price.map_batches(
+                lambda s: pl.Series(rsi_wilder(s.to_numpy().astype(np.float64), 14)),
+                return_dtype=pl.Float64
+            ).fill_nan(None).alias('rsi_14'),
+            macd.alias('macd'),
+            macd_signal.alias('macd_signal'),
+            (macd - macd_signal).alias('macd_histogram'),
+            bb_upper.alias('bb_upper'),
+            bb_lower.alias('bb_lower'),
+            bb_width.alias('bb_width'),
+            pl.when(bb_width != 0).then((price - bb_lower) / bb_width).alias('bb_position'),
             
-            # Rolling median
-            col_name = f'{target_column}_median_{window}'
-            feature_df[col_name] = feature_df[target_column].rolling(window=window).median()
-            self.feature_categories['time_series'].append(col_name)
+            # Momentum indicators
+            (price / price.shift(10)).alias('momentum_10'),
+            (price / price.shift(20)).alias('momentum_20'),
+            ((price - price.shift(10)) / price.shift(10) * 100).alias('rate_of_change_10')
+        ]
+        
+        return self._register_polars_exprs('technical', exprs)
+    
+    def _polars_interaction_exprs(self, columns: List[str]) -> List[Any]:
+        """상호작용 특징 (Polars 표현식)"""
+        exprs = []
+        
+        # 국제유가 × 환율 상호작용
+        for oil_col in self._col_index['oil'][:2]:  # 처음 2개만 사용
+            for exchange_col in self._col_index['exchange'][:2]:
+                exprs.append((pl.col(oil_col) * pl.col(exchange_col)).alias(f'{oil_col}_x_{exchange_col}'))
+        
+        # 계절성 × 가격 변동성 상호작용
+        if 'month' in columns:
+            for vol_col in self._col_index['volatility'][:2]:
+                exprs.append((pl.col('month') * pl.col(vol_col)).alias(f'month_x_{vol_col}'))
+        
+        return self._register_polars_exprs('interaction', exprs)
+    
+    def _calculate_feature_importance_polars(self, df: Any, target_column: str,
+                                             date_column: str) -> Dict[str, float]:
+        """특징 중요도 계산 (Polars DataFrame)"""
+        logger.info("특징 중요도 계산...")
+        
+        # 결측값(null/NaN)이 있는 행 제거
+        clean_df = df.drop(date_column).with_columns(
+            pl.col(pl.Float32, pl.Float64).fill_nan(None)
+        ).drop_nulls()
+        
+        if clean_df.height < 100:
+            logger.warning("충분한 데이터가 없어 특징 중요도 계산 스킵")
+            return {}
+        
+        feature_columns = [col for col in clean_df.columns if col != target_column]
+        numeric_columns = [col for col in feature_columns
+                           if clean_df.schema[col].is_numeric() or clean_df.schema[col] == pl.Boolean]
+        values = clean_df.select(numeric_columns + [target_column]).cast(pl.Float64).to_numpy()
+        corrs = self._target_correlations(values)
+        
+        # 수치형이 아닌 컬럼은 0
+        correlations = dict.fromkeys(feature_columns, 0.0)
+        correlations.update(zip(numeric_columns, corrs.tolist()))
+        
+        return correlations
+    
+    def _append_columns(self, df: pd.DataFrame, new_cols: Dict[str, Any]) -> pd.DataFrame:
+        """
+        단계별로 생성한 특징 컬럼을 한 번에 추가
+        
+        컬럼마다 삽입하면 블록 복사가 반복되므로 새 컬럼은 concat 한 번으로 붙이고,
+        기존에 있던 이름만 제자리에서 덮어씀
+        """
+        existing = [col for col in new_cols if col in df.columns]
+        for col in existing:
+            df[col] = new_cols.pop(col)
+        if not new_cols:
+            return df
+        return pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
+    
+    @staticmethod
+    def _col_categories(col: str) -> List[str]:
+        """상호작용 특징용 컬럼 분류 (국제유가/환율/변동성, 중복 가능)"""
+        name = col.lower()
+        categories = []
+        if 'dubai' in name or 'oil' in name:
+            categories.append('oil')
+        if 'exchange' in name or 'usd' in name:
+            categories.append('exchange')
+        if 'volatility' in col:
+            categories.append('volatility')
+        return categories
+    
+    def _reset_col_index(self, columns: List[str]):
+        """입력 컬럼으로 상호작용용 컬럼 목록 초기화 (이후 특징은 생성 단계에서 추가)"""
+        self._col_index = {'oil': [], 'exchange': [], 'volatility': []}
+        self._index_columns(columns)
+    
+    def _index_columns(self, columns: List[str]):
+        """새로 만든 컬럼을 상호작용용 컬럼 목록에 분류해 추가"""
+        for col in columns:
+            for category in self._col_categories(col):
+                self._col_index[category].append(col)
+    
+    def _create_time_series_features(self, df: pd.DataFrame, 
+                                   target_column: str) -> pd.DataFrame:
+        """시계열 기반 특징 생성"""
+        logger.info("시계열 특징 생성...")
+        
+        target = df[target_column]
+        new_cols = {}
+        
+        # Lag 특징
+        base_values = _float_values(target)
+        for lag in self.config.lag_features:
+            new_cols[f'{target_column}_lag_{lag}'] = _shift_values(base_values, lag)
+        
+        # Rolling 통계 특징 (Numba 사용 가능 시 mean/std/min/max를 창별 단일 순회로 계산)
+        target_values = target.to_numpy(dtype=np.float64)
+        for window in self.config.rolling_features:
+            rolling = target.rolling(window=window)
+            if NUMBA_AVAILABLE:
+                roll_mean, roll_std, roll_min, roll_max = roll_mean_std_min_max(target_values, window)
+            else:
+                roll_mean, roll_std = rolling.mean(), rolling.std()
+                roll_min, roll_max = rolling.min(), rolling.max()
+            new_cols[f'{target_column}_ma_{window}'] = roll_mean        # Rolling mean
+            new_cols[f'{target_column}_std_{window}'] = roll_std        # Rolling std
+            new_cols[f'{target_column}_min_{window}'] = roll_min        # Rolling min/max
+            new_cols[f'{target_column}_max_{window}'] = roll_max
+            new_cols[f'{target_column}_median_{window}'] = rolling.median()  # Rolling median
         
         # Difference 특징
         for diff_lag in self.config.diff_features:
-            col_name = f'{target_column}_diff_{diff_lag}'
-            feature_df[col_name] = feature_df[target_column].diff(diff_lag)
-            self.feature_categories['time_series'].append(col_name)
+            new_cols[f'{target_column}_diff_{diff_lag}'] = _diff_values(base_values, diff_lag)
             
             # Percentage change
-            col_name = f'{target_column}_pct_change_{diff_lag}'
-            feature_df[col_name] = feature_df[target_column].pct_change(diff_lag)
-            self.feature_categories['time_series'].append(col_name)
+            new_cols[f'{target_column}_pct_change_{diff_lag}'] = _pct_values(base_values, diff_lag)
         
-        # 변동성 특징
+        # 변동성 특징 (위에서 계산한 이동 평균/표준편차가 있으면 재사용)
         for window in [7, 14, 30]:
-            col_name = f'{target_column}_volatility_{window}'
-            feature_df[col_name] = feature_df[target_column].rolling(window=window).std() / \
-                                 feature_df[target_column].rolling(window=window).mean()
-            self.feature_categories['time_series'].append(col_name)
-        
-        return feature_df
+            roll_mean = new_cols.get(f'{target_column}_ma_{window}')
+            roll_std = new_cols.get(f'{target_column}_std_{window}')
+            if roll_mean is None or roll_std is None:
+                rolling = target.rolling(window=window)
+                roll_mean, roll_std = rolling.mean(), rolling.std()
+            roll_mean = np.asarray(roll_mean, dtype=np.float64)
+            roll_std = np.asarray(roll_std, dtype=np.float64)
+            volatility = np.full_like(roll_std, np.nan)
+            np.divide(roll_std, roll_mean, out=volatility, where=roll_mean != 0)
+            new_cols[f'{target_column}_volatility_{window}'] = volatility
+        
+        self.feature_categories['time_series'].extend(new_cols)
+        self._index_columns([col for col in new_cols if col not in df.columns])
+        return self._append_columns(df, new_cols)
     
     def _create_seasonal_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """계절성 및 달력 특징 생성"""
         logger.info("계절성 특징 생성...")
         
-        feature_df = df.copy()
+        if not isinstance(df.index, pd.DatetimeIndex):
+            return df
+        
+        # 달력 값은 인덱스에서 한 번씩만 추출하고 범위에 맞는 작은 정수형으로 보관
+        index = df.index
+        month = index.month.to_numpy(dtype=np.int8)
+        dayofweek = index.dayofweek.to_numpy(dtype=np.int8)
+        dayofyear = index.dayofyear.to_numpy(dtype=np.int16)
         
-        if not isinstance(feature_df.index, pd.DatetimeIndex):
-            return feature_df
+        # 순환 특징용 각도 (float32로 계산)
+        two_pi = np.float32(2 * np.pi)
+        month_angle = two_pi * month.astype(np.float32) / np.float32(12)
+        dayofweek_angle = two_pi * dayofweek.astype(np.float32) / np.float32(7)
+        dayofyear_angle = two_pi * dayofyear.astype(np.float32) / np.float32(365)
         
         # 기본 달력 특징
-        feature_df['year'] = feature_df.index.year
-        feature_df['month'] = feature_df.index.month
-        feature_df['day'] = feature_df.index.day
-        feature_df['dayofweek'] = feature_df.index.dayofweek
-        feature_df['dayofyear'] = feature_df.index.dayofyear
-        feature_df['week'] = feature_df.index.isocalendar().week
-        feature_df['quarter'] = feature_df.index.quarter
-        
-        # 순환적 특징 (월, 요일 등)
-        feature_df['month_sin'] = np.sin(2 * np.pi * feature_df['month'] / 12)
-        feature_df['month_cos'] = np.cos(2 * np.pi * feature_df['month'] / 12)
-        feature_df['dayofweek_sin'] = np.sin(2 * np.pi * feature_df['dayofweek'] / 7)
-        feature_df['dayofweek_cos'] = np.cos(2 * np.pi * feature_df['dayofweek'] / 7)
-        feature_df['dayofyear_sin'] = np.sin(2 * np.pi * feature_df['dayofyear'] / 365)
-        feature_df['dayofyear_cos'] = np.cos(2 * np.pi * feature_df['dayofyear'] / 365)
-        
-        seasonal_features = [
-            'year', 'month', 'day', 'dayofweek', 'dayofyear', 'week', 'quarter',
-            'month_sin', 'month_cos', 'dayofweek_sin', 'dayofweek_cos',
-            'dayofyear_sin', 'dayofyear_cos'
-        ]
-        self.feature_categories['seasonal'].extend(seasonal_features)
+        new_cols = {
+            'year': index.year.to_numpy(dtype=np.int16),
+            'month': month,
+            'day': index.day.to_numpy(dtype=np.int8),
+            'dayofweek': dayofweek,
+            'dayofyear': dayofyear,
+            'week': _iso_week_values(index, dayofweek),
+            'quarter': index.quarter.to_numpy(dtype=np.int8),
+            
+            # 순환적 특징 (월, 요일 등)
+            'month_sin': np.sin(month_angle),
+            'month_cos': np.cos(month_angle),
+            'dayofweek_sin': np.sin(dayofweek_angle),
+            'dayofweek_cos': np.cos(dayofweek_angle),
+            'dayofyear_sin': np.sin(dayofyear_angle),
+            'dayofyear_cos': np.cos(dayofyear_angle)
+        }
+        self.feature_categories['seasonal'].extend(new_cols)
         
-        # 계절 특징 (석유업계 특화)
-        feature_df['is_winter'] = feature_df['month'].isin([12, 1, 2]).astype(int)  # 난방 수요 증가
-        feature_df['is_summer'] = feature_df['month'].isin([6, 7, 8]).astype(int)  # 휴가철 수요 증가
-        feature_df['is_spring'] = feature_df['month'].isin([3, 4, 5]).astype(int)
-        feature_df['is_autumn'] = feature_df['month'].isin([9, 10, 11]).astype(int)
+        # 계절 특징 (석유업계 특화) - 계절 코드 0=겨울(난방 수요), 1=봄, 2=여름(휴가철 수요), 3=가을
+        # 원-핫이 필요한 모델은 season_onehot()으로 학습 시점에 확장
+        new_cols['season'] = ((month % 12) // 3).astype(np.int8)
+        self.feature_categories['seasonal'].append('season')
         
         # 휴일 특징
         if self.config.holiday_features:
-            feature_df['is_holiday'] = feature_df.index.map(
-                lambda x: 1 if x in self.korean_holidays else 0
-            )
-            feature_df['is_weekend'] = (feature_df['dayofweek'] >= 5).astype(int)
+            index_days = self._index_days(index)
+            new_cols['is_holiday'] = np.isin(index_days, self._holiday_days).astype(np.int8)
+            new_cols['is_weekend'] = (dayofweek >= 5).astype(np.int8)
             
             # 휴일 전후 효과
-            feature_df['days_to_holiday'] = self._calculate_days_to_holiday(feature_df.index)
-            feature_df['days_after_holiday'] = self._calculate_days_after_holiday(feature_df.index)
+            new_cols['days_to_holiday'] = self._calculate_days_to_holiday(index)
+            new_cols['days_after_holiday'] = self._calculate_days_after_holiday(index)
             
-            holiday_features = ['is_winter', 'is_summer', 'is_spring', 'is_autumn',
-                              'is_holiday', 'is_weekend', 'days_to_holiday', 'days_after_holiday']
+            holiday_features = ['is_holiday', 'is_weekend', 'days_to_holiday', 'days_after_holiday']
             self.feature_categories['seasonal'].extend(holiday_features)
         
-        return feature_df
+        return self._append_columns(df, new_cols)
     
     def _create_external_features(self, df: pd.DataFrame, 
                                 external_columns: List[str]) -> pd.DataFrame:
         """외부 요인 특징 생성"""
         logger.info("외부 요인 특징 생성...")
         
-        feature_df = df.copy()
+        new_cols = {}
         
-        for col in external_columns:
-            if col not in feature_df.columns:
+        # 컬럼별 계산은 서로 독립적이고 rolling 연산은 GIL을 해제하므로 스레드로 병렬 처리
+        columns = [col for col in external_columns if col in df.columns]
+        series_list = [df[col] for col in columns]
+        if len(columns) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(columns))) as executor:
+                results = list(executor.map(self._build_external_column, columns, series_list))
+        else:
+            results = [self._build_external_column(col, series)
+                       for col, series in zip(columns, series_list)]
+        
+        for col_features in results:
+            new_cols.update(col_features)
+        
+        self.feature_categories['external'].extend(new_cols)
+        self._index_columns([col for col in new_cols if col not in df.columns])
+        return self._append_columns(df, new_cols)
+    
+    def _external_lags(self, col: str) -> Tuple[int, ...]:
+        """외부 요인 컬럼 이름에 맞는 lag 설정"""
+        if 'oil' in col.lower() or 'dubai' in col.lower():
+            return self.config.oil_price_lags
+        if 'exchange' in col.lower() or 'rate' in col.lower():
+            return self.config.exchange_rate_lags
+        return (0, 1, 2, 3)
+    
+    def _build_external_column(self, col: str, series: pd.Series) -> Dict[str, Any]:
+        """외부 요인 컬럼 하나의 lag/rolling/변화율 특징 생성"""
+        out = {}
+        values = _float_values(series)
+        
+        # 기본 lag 특징
+        for lag in self._external_lags(col):
+            if lag == 0:
                 continue
-            
-            # 기본 lag 특징
-            if 'oil' in col.lower() or 'dubai' in col.lower():
-                lags = self.config.oil_price_lags
-            elif 'exchange' in col.lower() or 'rate' in col.lower():
-                lags = self.config.exchange_rate_lags
-            else:
-                lags = [0, 1, 2, 3]
-            
-            for lag in lags:
-                if lag == 0:
-                    continue
-                col_name = f'{col}_lag_{lag}'
-                feature_df[col_name] = feature_df[col].shift(lag)
-                self.feature_categories['external'].append(col_name)
-            
-            # Rolling 통계
-            for window in [7, 14, 30]:
-                col_name = f'{col}_ma_{window}'
-                feature_df[col_name] = feature_df[col].rolling(window=window).mean()
-                self.feature_categories['external'].append(col_name)
-                
-                col_name = f'{col}_std_{window}'
-                feature_df[col_name] = feature_df[col].rolling(window=window).std()
-                self.feature_categories['external'].append(col_name)
-            
-            # 변화율 특징
-            col_name = f'{col}_pct_change'
-            feature_df[col_name] = feature_df[col].pct_change()
-            self.feature_categories['external'].append(col_name)
-            
-            col_name = f'{col}_pct_change_7d'
-            feature_df[col_name] = feature_df[col].pct_change(7)
-            self.feature_categories['external'].append(col_name)
+            out[f'{col}_lag_{lag}'] = _shift_values(values, lag)
         
-        return feature_df
+        # Rolling 통계
+        for window in [7, 14, 30]:
+            rolling = series.rolling(window=window)
+            out[f'{col}_ma_{window}'] = rolling.mean()
+            out[f'{col}_std_{window}'] = rolling.std()
+        
+        # 변화율 특징
+        out[f'{col}_pct_change'] = _pct_values(values, 1)
+        out[f'{col}_pct_change_7d'] = _pct_values(values, 7)
+        return out
     
     def _create_technical_indicators(self, df: pd.DataFrame, 
                                    target_column: str) -> pd.DataFrame:
         """기술적 지표 특징 생성"""
         logger.info("기술적 지표 생성...")
         
-        feature_df = df.copy()
-        price = feature_df[target_column]
+        price = df[target_column]
+        new_cols = {}
         
-        # RSI (Relative Strength Index)
-        delta = price.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        feature_df['rsi_14'] = 100 - (100 / (1 + rs))
-        self.feature_categories['technical'].append('rsi_14')
+        # RSI (Relative Strength Index, Wilder 평활)
+        price_values = price.to_numpy(dtype=np.float64)
+        new_cols['rsi_14'] = rsi_wilder(price_values, 14)
         
         # MACD (Moving Average Convergence Divergence)
-        ema12 = price.ewm(span=12).mean()
-        ema26 = price.ewm(span=26).mean()
-        feature_df['macd'] = ema12 - ema26
-        feature_df['macd_signal'] = feature_df['macd'].ewm(span=9).mean()
-        feature_df['macd_histogram'] = feature_df['macd'] - feature_df['macd_signal']
-        
-        technical_features = ['macd', 'macd_signal', 'macd_histogram']
-        self.feature_categories['technical'].extend(technical_features)
-        
-        # Bollinger Bands
-        sma20 = price.rolling(window=20).mean()
-        std20 = price.rolling(window=20).std()
-        feature_df['bb_upper'] = sma20 + (2 * std20)
-        feature_df['bb_lower'] = sma20 - (2 * std20)
-        feature_df['bb_width'] = feature_df['bb_upper'] - feature_df['bb_lower']
-        feature_df['bb_position'] = (price - feature_df['bb_lower']) / feature_df['bb_width']
-        
-        bb_features = ['bb_upper', 'bb_lower', 'bb_width', 'bb_position']
-        self.feature_categories['technical'].extend(bb_features)
+        if NUMBA_AVAILABLE:
+            macd, macd_signal, macd_histogram = macd_kernel(price_values)
+        else:
+            ema12 = price.ewm(span=12).mean()
+            ema26 = price.ewm(span=26).mean()
+            macd = ema12 - ema26
+            macd_signal = macd.ewm(span=9).mean()
+            macd_histogram = macd - macd_signal
+        new_cols['macd'] = macd
+        new_cols['macd_signal'] = macd_signal
+        new_cols['macd_histogram'] = macd_histogram
+        
+        # Bollinger Bands (Numba 사용 가능 시 평균/표준편차를 단일 순회로 계산)
+        if NUMBA_AVAILABLE:
+            sma20, std20, _, _ = roll_mean_std_min_max(price_values, 20)
+        else:
+            rolling = price.rolling(window=20)
+            sma20 = rolling.mean().to_numpy(dtype=np.float64)
+            std20 = rolling.std().to_numpy(dtype=np.float64)
+        bb_lower = sma20 - (2 * std20)
+        bb_width = 4 * std20  # 상단 - 하단
+        bb_position = np.full_like(bb_width, np.nan)
+        np.divide(price_values - bb_lower, bb_width, out=bb_position, where=bb_width != 0)
+        new_cols['bb_upper'] = sma20 + (2 * std20)
+        new_cols['bb_lower'] = bb_lower
+        new_cols['bb_width'] = bb_width
+        new_cols['bb_position'] = bb_position
         
         # Momentum indicators
-        feature_df['momentum_10'] = price / price.shift(10)
-        feature_df['momentum_20'] = price / price.shift(20)
-        feature_df['rate_of_change_10'] = (price - price.shift(10)) / price.shift(10) * 100
-        
-        momentum_features = ['momentum_10', 'momentum_20', 'rate_of_change_10']
-        self.feature_categories['technical'].extend(momentum_features)
+        new_cols['momentum_10'] = price / price.shift(10)
+        new_cols['momentum_20'] = price / price.shift(20)
+        new_cols['rate_of_change_10'] = (price - price.shift(10)) / price.shift(10) * 100
         
-        return feature_df
+        self.feature_categories['technical'].extend(new_cols)
+        return self._append_columns(df, new_cols)
     
     def _create_regional_features(self, df: pd.DataFrame, 
                                 target_column: str) -> pd.DataFrame:
         """지역별 특성 특징 생성"""
         logger.info("지역별 특성 특징 생성...")
         
-        feature_df = df.copy()
-        
         # 가격 스프레드 특징 (전국 평균과의 차이)
         if 'national_' in target_column:
             # 이미 전국 평균 데이터인 경우 스킵
-            return feature_df
+            return df
         
         # 전국 평균 대비 스프레드 (추후 구현)
         # 현재는 기본적인 지역 특성만 구현
         
-        return feature_df
+        return df
     
     def _create_interaction_features(self, df: pd.DataFrame, 
                                    target_column: str) -> pd.DataFrame:
         """상호작용 특징 생성"""
         logger.info("상호작용 특징 생성...")
         
-        feature_df = df.copy()
+        new_cols = {}
         
         # 국제유가 × 환율 상호작용
-        oil_cols = [col for col in feature_df.columns if 'dubai' in col.lower() or 'oil' in col.lower()]
-        exchange_cols = [col for col in feature_df.columns if 'exchange' in col.lower() or 'usd' in col.lower()]
-        
-        for oil_col in oil_cols[:2]:  # 처음 2개만 사용
-            for exchange_col in exchange_cols[:2]:
-                if oil_col in feature_df.columns and exchange_col in feature_df.columns:
-                    col_name = f'{oil_col}_x_{exchange_col}'
-                    feature_df[col_name] = feature_df[oil_col] * feature_df[exchange_col]
-                    self.feature_categories['interaction'].append(col_name)
+        for oil_col in self._col_index['oil'][:2]:  # 처음 2개만 사용
+            for exchange_col in self._col_index['exchange'][:2]:
+                col_name = f'{oil_col}_x_{exchange_col}'
+                new_cols[col_name] = df[oil_col] * df[exchange_col]
         
         # 계절성 × 가격 변동성 상호작용
-        if 'month' in feature_df.columns:
-            volatility_cols = [col for col in feature_df.columns if 'volatility' in col]
-            for vol_col in volatility_cols[:2]:
-                col_name = f'month_x_{vol_col}'
-                feature_df[col_name] = feature_df['month'] * feature_df[vol_col]
-                self.feature_categories['interaction'].append(col_name)
+        if 'month' in df.columns:
+            for vol_col in self._col_index['volatility'][:2]:
+                new_cols[f'month_x_{vol_col}'] = df['month'] * df[vol_col]
         
-        return feature_df
+        self.feature_categories['interaction'].extend(new_cols)
+        return self._append_columns(df, new_cols)
     
     def _calculate_feature_importance(self, df: pd.DataFrame, 
                                     target_column: str) -> Dict[str, float]:
@@ -383,17 +1002,38 @@ class FeatureEngineer:
         
         feature_columns = [col for col in clean_df.columns if col != target_column]
         
-        # 상관관계 기반 중요도
-        correlations = {}
-        for col in feature_columns:
-            try:
-                corr = abs(clean_df[col].corr(clean_df[target_column]))
-                correlations[col] = corr if not np.isnan(corr) else 0.0
-            except:
-                correlations[col] = 0.0
+        # 상관관계 기반 중요도 (타깃과의 피어슨 상관을 행렬 연산 한 번으로 계산)
+        numeric_columns = clean_df[feature_columns].select_dtypes(include=['number', 'bool']).columns
+        values = clean_df[list(numeric_columns) + [target_column]].to_numpy(dtype=np.float64)
+        corrs = self._target_correlations(values)
+        
+        # 수치형이 아닌 컬럼은 0
+        correlations = dict.fromkeys(feature_columns, 0.0)
+        correlations.update(zip(numeric_columns, corrs.tolist()))
         
         return correlations
     
+    @staticmethod
+    def _target_correlations(values: np.ndarray) -> np.ndarray:
+        """
+        마지막 열(타깃)과 나머지 각 열의 피어슨 상관 절댓값
+        
+        계산할 수 없는 열(상수 등)은 0
+        """
+        # 긴 시계열은 균등 간격으로 표본 추출해 상관 추정 (상관은 2차 모멘트만 필요)
+        if len(values) > _IMPORTANCE_MAX_ROWS:
+            values = values[::len(values) // _IMPORTANCE_MAX_ROWS]
+        
+        centered = values - values.mean(axis=0)
+        norms = np.sqrt(np.einsum('ij,ij->j', centered, centered))
+        
+        # 사실상 상수인 컬럼은 상관이 0이므로 행렬 곱에서 제외
+        keep = norms[:-1] > _IMPORTANCE_MIN_STD * np.sqrt(len(values))
+        corrs = np.zeros(values.shape[1] - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corrs[keep] = np.abs(centered[:, :-1][:, keep].T @ centered[:, -1]) / (norms[:-1][keep] * norms[-1])
+        return np.nan_to_num(corrs, nan=0.0, posinf=0.0, neginf=0.0)
+    
     def _select_features(self, df: pd.DataFrame, 
                         target_column: str,
                         feature_importance: Dict[str, float]) -> List[str]:
@@ -401,50 +1041,79 @@ class FeatureEngineer:
         logger.info("특징 선택...")
         
         # 중요도 임계값 이상의 특징만 선택
-        selected_features = [
-            col for col, importance in feature_importance.items()
-            if importance >= 0.01  # 최소 중요도 임계값
-        ]
-        
-        # 중요도 순으로 정렬
-        selected_features.sort(key=lambda x: feature_importance[x], reverse=True)
-        
-        # 최대 특징 수 제한
-        max_features = min(100, len(selected_features))  # 최대 100개 특징
-        selected_features = selected_features[:max_features]
+        names = np.array(list(feature_importance.keys()), dtype=object)
+        importances = np.fromiter(feature_importance.values(), dtype=np.float64, count=len(names))
+        mask = importances >= 0.01  # 최소 중요도 임계값
+        names, importances = names[mask], importances[mask]
+        
+        # 최대 특징 수 제한 - 전체 정렬 대신 상위 k개만 분할로 고른 뒤 정렬
+        max_features = min(100, len(names))  # 최대 100개 특징
+        if max_features < len(names):
+            threshold = np.partition(importances, len(names) - max_features)[len(names) - max_features]
+            above = np.flatnonzero(importances > threshold)
+            # 경계값 동점은 기존 순서가 앞선 특징부터 채움
+            ties = np.flatnonzero(importances == threshold)[:max_features - len(above)]
+            top = np.concatenate([above, ties])
+        else:
+            top = np.arange(len(names))
+        
+        # 중요도 순으로 정렬 (동점은 기존 순서 유지)
+        top = top[np.lexsort((top, -importances[top]))]
+        selected_features = names[top].tolist()
         
         logger.info(f"특징 선택 완료: {len(selected_features)}개 선택")
         
         return selected_features
     
-    def _calculate_days_to_holiday(self, date_index: pd.DatetimeIndex) -> pd.Series:
-        """다음 휴일까지 남은 일수 계산"""
-        days_to_holiday = []
-        
-        for date in date_index:
-            future_dates = pd.date_range(start=date, end=date + timedelta(days=30), freq='D')
-            holiday_distances = [
-                (future_date - date).days 
-                for future_date in future_dates 
-                if future_date in self.korean_holidays
-            ]
-            
-            days_to_holiday.append(min(holiday_distances) if holiday_distances else 30)
+    def _build_holiday_days(self) -> np.ndarray:
+        """휴일 날짜를 epoch 기준 일수의 정렬 배열로 변환"""
+        return np.sort(np.array(list(self.korean_holidays.keys()), dtype='datetime64[D]').astype(np.int64))
+    
+    def _index_days(self, date_index: pd.DatetimeIndex) -> np.ndarray:
+        """날짜 인덱스를 epoch 기준 일수로 변환하고, 필요한 연도의 휴일을 확보"""
+        days = date_index.values.astype('datetime64[D]').astype(np.int64)
+        
+        if len(date_index) > 0:
+            self._ensure_holiday_years(int(date_index.year.min()), int(date_index.year.max()))
         
-        return pd.Series(days_to_holiday, index=date_index)
+        return days
     
-    def _calculate_days_after_holiday(self, date_index: pd.DatetimeIndex) -> pd.Series:
-        """가장 최근 휴일 이후 경과 일수 계산"""
-        days_after_holiday = []
-        
-        for date in date_index:
-            past_dates = pd.date_range(start=date - timedelta(days=30), end=date, freq='D')
-            holiday_distances = [
-                (date - past_date).days 
-                for past_date in past_dates 
-                if past_date in self.korean_holidays
-            ]
-            
-            days_after_holiday.append(min(holiday_distances) if holiday_distances else 30)
+    def _ensure_holiday_years(self, first_year: int, last_year: int):
+        """±30일 범위가 걸치는 연도의 휴일이 없으면 해당 연도 휴일을 생성해 추가"""
+        years = range(first_year - 1, last_year + 2)
+        missing_years = [year for year in years if year not in self.korean_holidays.years]
+        if missing_years:
+            self.korean_holidays.update(holidays.SouthKorea(years=missing_years))
+            self._holiday_days = self._build_holiday_days()
+    
+    def _days_to_holiday_values(self, days: np.ndarray) -> np.ndarray:
+        """epoch 일수 배열 기준 다음 휴일까지 남은 일수 (최대 30일)"""
+        holiday_days = self._holiday_days
         
-        return pd.Series(days_after_holiday, index=date_index)
\ No newline at end of file
+        pos = np.searchsorted(holiday_days, days, side='left')
+        has_next = pos < len(holiday_days)
+        distance = np.full(len(days), 30, dtype=np.int64)
+        distance[has_next] = holiday_days[pos[has_next]] - days[has_next]
+        
+        return np.minimum(distance, 30)
+    
+    def _days_after_holiday_values(self, days: np.ndarray) -> np.ndarray:
+        """epoch 일수 배열 기준 가장 최근 휴일 이후 경과 일수 (최대 30일)"""
+        holiday_days = self._holiday_days
+        
+        pos = np.searchsorted(holiday_days, days, side='right') - 1
+        has_prev = pos >= 0
+        distance = np.full(len(days), 30, dtype=np.int64)
+        distance[has_prev] = days[has_prev] - holiday_days[pos[has_prev]]
+        
+        return np.minimum(distance, 30)
+    
+    def _calculate_days_to_holiday(self, date_index: pd.DatetimeIndex) -> pd.Series:
+        """다음 휴일까지 남은 일수 계산 (최대 30일)"""
+        days = self._index_days(date_index)
+        return pd.Series(self._days_to_holiday_values(days), index=date_index)
+    
+    def _calculate_days_after_holiday(self, date_index: pd.DatetimeIndex) -> pd.Series:
+        """가장 최근 휴일 이후 경과 일수 계산 (최대 30일)"""
+        days = self._index_days(date_index)
+        return pd.Series(self._days_after_holiday_values(days), index=date_index)
@@ -8,14 +8,180 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union, Any
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
-from sklearn.impute import SimpleImputer, KNNImputer
+from sklearn.ensemble import IsolationForest
 import logging
-from dataclasses import dataclass
+import pickle
+import warnings
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from joblib import Memory, Parallel, delayed
 
 from ..config.model_config import TimeSeriesConfig
+from .._numba import njit
+
+# 전처리 결과 Parquet/Arrow 직렬화 (pyarrow, 선택사항)
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# 품질 점수의 변동계수 검증에 사용할 최대 표본 행 수 (점수는 [0, 1]로 잘리므로 표본 오차 무시 가능)
+_VALIDATION_SAMPLE_ROWS = 10_000
+
+# 스케일 대상 컬럼이 이 개수 이상이면 컬럼 묶음 단위로 나눠 스레드 병렬 학습
+_PARALLEL_SCALING_MIN_COLUMNS = 32
+_SCALING_CHUNK_COLUMNS = 8
+
+# 스케일러 종류와 역변환/변환에 필요한 학습 파라미터
+_SCALER_TYPES = {
+    'minmax': MinMaxScaler,
+    'standard': StandardScaler,
+    'robust': RobustScaler
+}
+_SCALER_PARAMS = {
+    'minmax': ('min_', 'scale_', 'data_min_', 'data_max_', 'data_range_',
+               'n_samples_seen_', 'n_features_in_'),
+    'standard': ('mean_', 'var_', 'scale_', 'n_samples_seen_', 'n_features_in_'),
+    'robust': ('center_', 'scale_', 'n_features_in_')
+}
+
+
+@njit(cache=True)
+def _linear_fill(a: np.ndarray) -> int:
+    """
+    결측 구간을 양쪽 유효값 사이 선형 보간으로 제자리 채우고 앞쪽 결측 개수 반환
+
+    Series.interpolate(method='linear')와 동일하게 위치 간격을 균등으로 보고
+    앞쪽 결측은 그대로, 뒤쪽 결측은 마지막 유효값으로 채움.
+    반환값(첫 유효값 위치, 유효값이 없으면 길이) 이후에는 결측값이 남지 않음
+    """
+    n = a.shape[0]
+    first = n
+    last = -1
+    for i in range(n):
+        if np.isnan(a[i]):
+            continue
+        if last < 0:
+            first = i
+        if last >= 0 and i - last > 1:
+            left = np.float64(a[last])
+            slope = (np.float64(a[i]) - left) / (i - last)
+            for k in range(last + 1, i):
+                a[k] = slope * (k - last) + left
+        last = i
+    if last >= 0:
+        for k in range(last + 1, n):
+            a[k] = a[last]
+    return first
+
+
+def _bfill_ffill(a: np.ndarray) -> None:
+    """결측값을 다음 유효값으로, 남은 끝부분은 이전 유효값으로 제자리 채움 (Series.bfill().ffill()과 동일)"""
+    valid = ~np.isnan(a)
+    if valid.all() or not valid.any():
+        return
+    
+    n = a.shape[0]
+    positions = np.arange(n)
+    next_valid = np.minimum.accumulate(np.where(valid, positions, n)[::-1])[::-1]
+    prev_valid = np.maximum.accumulate(np.where(valid, positions, -1))
+    a[:] = a[np.where(next_valid < n, next_valid, prev_valid)]
+
+
+def _nan_range(a: np.ndarray) -> List[float]:
+    """결측값을 제외한 [최소, 최대] (유효값이 없으면 NaN)"""
+    valid = a[~np.isnan(a)]
+    if valid.size == 0:
+        return [np.nan, np.nan]
+    return [valid.min(), valid.max()]
+
+
+def _nan_mean_std(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (N, K) 배열의 컬럼별 유효 개수, 평균, 표준편차(ddof=1)를 결측값을 제외하고 한 번의 순회로 계산
+
+    합과 제곱합을 동시에 누적(einsum)하되 컬럼별 첫 유효값만큼 이동해 상쇄 오차를 줄이며,
+    상수 컬럼의 표준편차는 정확히 0
+    """
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=0)
+    reference = values[valid.argmax(axis=0), np.arange(values.shape[1])]
+    shifted = np.where(valid, values - reference, 0.0)
+    
+    total = shifted.sum(axis=0)
+    total_sq = np.einsum('ij,ij->j', shifted, shifted)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = reference + total / count
+        var = np.maximum(total_sq - total * total / count, 0.0) / (count - 1)
+    return count, mean, np.sqrt(var)
+
+
+def _fit_scaler(scaler_type: str, values: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """스케일러를 학습해 (스케일된 값, 학습 파라미터) 반환 - joblib.Memory 캐시 대상"""
+    scaler = _SCALER_TYPES[scaler_type](copy=False)
+    scaled_values = scaler.fit_transform(values)
+    return scaled_values, {name: getattr(scaler, name) for name in _SCALER_PARAMS[scaler_type]}
+
+
+def _restore_scaler(scaler_type: str, params: Dict[str, Any]):
+    """캐시된 학습 파라미터로 학습된 상태의 스케일러 복원 (객체 전체를 피클링하지 않음)"""
+    scaler = _SCALER_TYPES[scaler_type]()
+    for name, value in params.items():
+        setattr(scaler, name, value)
+    return scaler
+
+
+def _require_pyarrow(caller: str):
+    """pyarrow 미설치 시 ImportError"""
+    if not PYARROW_AVAILABLE:
+        raise ImportError(f"{caller}를 사용하려면 pyarrow가 필요합니다")
+
+
+@dataclass(slots=True)
+class CovidSummary:
+    """COVID-19 기간 처리 요약"""
+    method: str
+    affected_records: int
+    covid_start: Optional[str] = None
+    covid_end: Optional[str] = None
+
+
+@dataclass(slots=True)
+class OutlierSummary:
+    """이상치 처리 요약 (details: 컬럼별 {'count', 'percentage'})"""
+    outliers_removed: int
+    method: str
+    details: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class MissingSummary:
+    """결측값 처리 요약"""
+    values_filled: int
+    initial_missing: int
+    final_missing: int
+
+
+@dataclass(slots=True)
+class ScalingSummary:
+    """스케일링 요약 (columns: 컬럼별 스케일러 종류)"""
+    columns: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ProcessingSummary:
+    """전처리 단계별 요약"""
+    date_setup: str
+    covid_handling: CovidSummary
+    outlier_handling: OutlierSummary
+    missing_handling: MissingSummary
+    scaling: ScalingSummary
+    quality_score: float
+
+
 @dataclass
 class PreprocessingResult:
     """전처리 결과"""
@@ -23,7 +189,66 @@ class PreprocessingResult:
     scaler_info: Dict[str, Any]
     outliers_removed: int
     missing_values_filled: int
-    processing_summary: Dict[str, Any]
+    processing_summary: ProcessingSummary
+    
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        결과를 디렉터리에 저장 (데이터는 Parquet, 스케일러 등 작은 메타정보만 pickle)
+        
+        Args:
+            path: 저장 디렉터리
+        
+        Returns:
+            저장 디렉터리 경로
+        """
+        _require_pyarrow('PreprocessingResult.save')
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        
+        self.processed_data.to_parquet(path / 'data.parquet', engine='pyarrow', compression='zstd')
+        meta = {
+            'scaler_info': self.scaler_info,
+            'outliers_removed': self.outliers_removed,
+            'missing_values_filled': self.missing_values_filled,
+            'processing_summary': self.processing_summary
+        }
+        with open(path / 'meta.pkl', 'wb') as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        return path
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'PreprocessingResult':
+        """save()로 저장한 결과 로드"""
+        _require_pyarrow('PreprocessingResult.load')
+        path = Path(path)
+        
+        processed_data = pd.read_parquet(path / 'data.parquet', engine='pyarrow')
+        with open(path / 'meta.pkl', 'rb') as f:
+            meta = pickle.load(f)
+        
+        return cls(processed_data=processed_data, **meta)
+    
+    def to_arrow(self) -> 'pa.Table':
+        """전처리 데이터를 Arrow Table로 변환 (날짜 인덱스 포함)"""
+        _require_pyarrow('PreprocessingResult.to_arrow')
+        return pa.Table.from_pandas(self.processed_data, preserve_index=True)
+    
+    def to_arrow_ipc(self, path: Union[str, Path]) -> Path:
+        """
+        전처리 데이터를 비압축 Arrow IPC 파일로 기록 (학습 워커 전달용)
+        
+        워커는 pa.ipc.open_file(pa.memory_map(path)).read_all()로
+        역직렬화 없이 메모리 매핑해 읽을 수 있음
+        """
+        table = self.to_arrow()
+        path = Path(path)
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        
+        return path
+
 
 class DataPreprocessor:
     """
@@ -34,11 +259,16 @@ class DataPreprocessor:
     - 다중 스케일링 전략
     """
     
-    def __init__(self, config: TimeSeriesConfig):
+    def __init__(self, config: TimeSeriesConfig, memory: Optional[Memory] = None):
         self.config = config
         self.scalers = {}
         self.imputers = {}
         
+        # 교차검증/하이퍼파라미터 탐색 등 반복 호출 시 스케일러 학습 결과 캐시 (선택사항)
+        # 단발성 호출에는 캐시 비용이 더 크므로 memory가 없으면 매번 직접 학습
+        self.memory = memory
+        self._cached_fit_scaler = memory.cache(_fit_scaler) if memory is not None else None
+        
         # COVID-19 기간 정의
         self.covid_start = pd.to_datetime(config.covid_start)
         self.covid_end = pd.to_datetime(config.covid_end)
@@ -51,6 +281,9 @@ class DataPreprocessor:
         """
         전체 데이터 전처리 파이프라인
         
+        원본 df는 변경하지 않으며, 날짜 인덱스 설정 이후 단계는 컬럼별 NumPy 배열 dict와
+        공유 날짜 인덱스로 처리한 뒤 반환 직전에 DataFrame을 한 번만 다시 구성
+        
         Args:
             df: 원본 데이터프레임
             target_columns: 예측 대상 컬럼들
@@ -61,325 +294,383 @@ class DataPreprocessor:
         """
         logger.info("데이터 전처리 시작...")
         
-        processed_df = df.copy()
-        processing_summary = {}
-        
         # 1. 날짜 인덱스 설정
-        processed_df = self._setup_date_index(processed_df)
-        processing_summary['date_setup'] = "완료"
+        processed_df = self._setup_date_index(df)
+        
+        # 컬럼별 배열(SoA)로 변환 - 각 단계는 이 배열들을 직접 수정
+        data = {col: processed_df[col].to_numpy(copy=True) for col in processed_df.columns}
+        index = processed_df.index
         
         # 2. COVID-19 기간 처리
-        covid_result = self._handle_covid_period(processed_df, target_columns)
-        processed_df = covid_result['data']
-        processing_summary['covid_handling'] = covid_result['summary']
+        covid_result = self._handle_covid_period(data, index, target_columns)
+        data, index = covid_result['data'], covid_result['index']
         
         # 3. 이상치 탐지 및 처리
-        outlier_result = self._handle_outliers(processed_df, target_columns)
-        processed_df = outlier_result['data']
-        processing_summary['outlier_handling'] = outlier_result['summary']
+        outlier_result = self._handle_outliers(data, target_columns)
         
         # 4. 결측값 처리
-        missing_result = self._handle_missing_values(processed_df, target_columns)
-        processed_df = missing_result['data']
-        processing_summary['missing_handling'] = missing_result['summary']
+        missing_result = self._handle_missing_values(data, index, target_columns)
         
         # 5. 데이터 스케일링
-        scaling_result = self._scale_data(processed_df, target_columns, feature_columns)
-        processed_df = scaling_result['data']
-        processing_summary['scaling'] = scaling_result['summary']
+        scaling_result = self._scale_data(data, target_columns, feature_columns)
+        
+        processed_df = pd.DataFrame(data, index=index)
         
         # 6. 데이터 품질 검증
         quality_score = self._validate_processed_data(processed_df)
-        processing_summary['quality_score'] = quality_score
         
         logger.info(f"데이터 전처리 완료: 품질 점수 {quality_score:.3f}")
         
+        processing_summary = ProcessingSummary(
+            date_setup="완료",
+            covid_handling=covid_result['summary'],
+            outlier_handling=outlier_result['summary'],
+            missing_handling=missing_result['summary'],
+            scaling=scaling_result['summary'],
+            quality_score=quality_score
+        )
+        
         return PreprocessingResult(
             processed_data=processed_df,
             scaler_info=self.scalers,
-            outliers_removed=outlier_result['summary']['outliers_removed'],
-            missing_values_filled=missing_result['summary']['values_filled'],
+            outliers_removed=processing_summary.outlier_handling.outliers_removed,
+            missing_values_filled=processing_summary.missing_handling.values_filled,
             processing_summary=processing_summary
         )
     
     def _setup_date_index(self, df: pd.DataFrame) -> pd.DataFrame:
-        """날짜 인덱스 설정 및 정규화"""
+        """날짜 인덱스 설정 및 정규화 (원본 df는 변경하지 않음)"""
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.set_index('date').sort_index()
+            df = df.assign(date=pd.to_datetime(df['date'])).set_index('date')
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         
-        # 중복 날짜 제거 (평균값 사용)
-        df = df.groupby(df.index).mean()
+        # 중복 날짜 제거 (평균값 사용) - 정렬된 인덱스가 이미 유일하면 집계 생략
+        if not df.index.is_unique:
+            df = df.groupby(level=0, sort=False).mean()
         
         # 날짜 범위 보간 (일별 데이터로 정규화)
         full_date_range = pd.date_range(start=df.index.min(), end=df.index.max(), freq='D')
-        df = df.reindex(full_date_range)
+        if df.index.equals(full_date_range):
+            # 이미 빠짐없는 일별 데이터면 재정렬/복사 없이 인덱스만 교체
+            df = df.set_axis(full_date_range, axis=0)
+        else:
+            df = df.reindex(full_date_range)
+        
+        # 수치 컬럼은 float32로 통일 (유가/환율은 10^3 규모라 유효숫자 약 7자리로 충분하며
+        # 이후 보간/그룹 평균/스케일링 단계의 메모리 이동량이 절반으로 줄어듦,
+        # 평균 집계를 생략한 경우에도 정수/불리언 컬럼이 결측값을 담을 수 있도록 함께 변환)
+        numeric_columns = df.select_dtypes(include=[np.number, 'bool']).columns
+        df = df.astype({col: np.float32 for col in numeric_columns})
         
         return df
     
-    def _handle_covid_period(self, df: pd.DataFrame, 
+    def _handle_covid_period(self, data: Dict[str, np.ndarray], index: pd.DatetimeIndex,
                            target_columns: List[str]) -> Dict[str, Any]:
-        """COVID-19 기간 데이터 처리"""
-        covid_mask = (df.index >= self.covid_start) & (df.index <= self.covid_end)
-        covid_data_count = covid_mask.sum()
+        """COVID-19 기간 데이터 처리 (data 배열을 직접 수정, 행 제거 시 새 인덱스 반환)"""
+        # 인덱스는 _setup_date_index에서 정렬되어 있으므로 이진 탐색으로 위치 구간 [lo, hi) 계산
+        lo = index.searchsorted(self.covid_start, side='left')
+        hi = index.searchsorted(self.covid_end, side='right')
+        covid_data_count = int(hi - lo)
         
         if covid_data_count == 0:
             return {
-                'data': df,
-                'summary': {'method': 'no_covid_data', 'affected_records': 0}
+                'data': data,
+                'index': index,
+                'summary': CovidSummary(method='no_covid_data', affected_records=0)
             }
         
         logger.info(f"COVID-19 기간 데이터 처리: {covid_data_count}개 레코드")
         
         if self.config.covid_handling == "remove":
             # COVID-19 기간 데이터 제거
-            df_processed = df[~covid_mask].copy()
+            for col, values in data.items():
+                data[col] = np.concatenate((values[:lo], values[hi:]))
+            index = index.delete(slice(lo, hi))
             method = "removed"
             
         elif self.config.covid_handling == "interpolate":
-            # 고급 보간 기법 사용
-            df_processed = df.copy()
-            
-            for col in target_columns:
-                if col in df_processed.columns:
-                    # COVID 이전/이후 추세를 고려한 보간
-                    pre_covid = df_processed[df_processed.index < self.covid_start][col]
-                    post_covid = df_processed[df_processed.index > self.covid_end][col]
+            # 고급 보간 기법 사용 (COVID 이전/이후 30일이 모두 있어야 추세 계산 가능)
+            if lo > 30 and len(index) - hi > 30:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
                     
-                    if len(pre_covid) > 30 and len(post_covid) > 30:
-                        # 선형 보간으로 COVID 기간 데이터 대체
-                        pre_trend = pre_covid.tail(30).mean()
-                        post_trend = post_covid.head(30).mean()
-                        
-                        covid_indices = df_processed[covid_mask].index
-                        interpolated_values = np.linspace(pre_trend, post_trend, len(covid_indices))
-                        
-                        df_processed.loc[covid_mask, col] = interpolated_values
+                    for col in target_columns:
+                        if col in data:
+                            # COVID 이전/이후 추세를 고려한 보간 (연속 배열 슬라이스로 계산)
+                            values = data[col]
+                            pre_trend = np.nanmean(values[lo - 30:lo])
+                            post_trend = np.nanmean(values[hi:hi + 30])
+                            
+                            # 선형 보간으로 COVID 기간 데이터 대체 (컬럼 dtype으로 바로 기록)
+                            values[lo:hi] = np.linspace(pre_trend, post_trend, hi - lo, dtype=values.dtype)
             
             method = "interpolated"
             
         elif self.config.covid_handling == "weight":
             # 가중치 감소 (모델에서 처리)
-            df_processed = df.copy()
-            df_processed.loc[covid_mask, 'covid_weight'] = 0.3  # 30% 가중치
+            if 'covid_weight' not in data:
+                data['covid_weight'] = np.full(len(index), np.nan)
+            data['covid_weight'][lo:hi] = 0.3  # 30% 가중치
             method = "weighted"
             
         else:
-            df_processed = df.copy()
             method = "unchanged"
         
         return {
-            'data': df_processed,
-            'summary': {
-                'method': method,
-                'affected_records': covid_data_count,
-                'covid_start': self.covid_start.strftime('%Y-%m-%d'),
-                'covid_end': self.covid_end.strftime('%Y-%m-%d')
-            }
+            'data': data,
+            'index': index,
+            'summary': CovidSummary(
+                method=method,
+                affected_records=covid_data_count,
+                covid_start=self.covid_start.strftime('%Y-%m-%d'),
+                covid_end=self.covid_end.strftime('%Y-%m-%d')
+            )
         }
     
-    def _handle_outliers(self, df: pd.DataFrame, 
+    def _handle_outliers(self, data: Dict[str, np.ndarray],
                         target_columns: List[str]) -> Dict[str, Any]:
-        """이상치 탐지 및 처리"""
-        df_processed = df.copy()
-        outliers_removed = 0
+        """이상치 탐지 및 처리 (data 배열을 직접 수정)"""
         outlier_details = {}
         
-        for col in target_columns:
-            if col not in df_processed.columns:
-                continue
+        columns = [col for col in target_columns if col in data]
+        if columns:
+            values = np.column_stack([data[col] for col in columns]).astype(np.float64, copy=False)
+        else:
+            values = np.empty((0, 0))
+        valid_counts = (~np.isnan(values)).sum(axis=0)
+        outlier_mask = np.zeros(values.shape, dtype=bool)
+        
+        if columns and self.config.outlier_method in ("z_score", "iqr"):
+            # 대상 컬럼 전체를 (N, K) 배열 하나로 처리 (결측값은 비교에서 자동 제외)
+            with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+                warnings.simplefilter('ignore', RuntimeWarning)
+                
+                if self.config.outlier_method == "z_score":
+                    # Z-score 기반 이상치 탐지
+                    _, means, stds = _nan_mean_std(values)
+                    outlier_mask = np.abs((values - means) * (1.0 / stds)) > 3
+                    
+                else:
+                    # IQR 기반 이상치 탐지 (석유업계 맞춤)
+                    Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
+                    IQR = Q3 - Q1
+                    
+                    # 석유 가격 특성상 더 넓은 범위 사용
+                    lower_bound = Q1 - 2.0 * IQR
+                    upper_bound = Q3 + 2.0 * IQR
+                    
+                    # 범위 밖이면 두 거리의 부호가 달라 곱이 음수 (비교 두 번 + OR 대신 곱셈-비교 한 번,
+                    # 경계값은 곱이 0이라 정상, 결측값은 NaN 비교로 제외)
+                    outlier_mask = (values - lower_bound) * (upper_bound - values) < 0
             
-            values = df_processed[col].dropna()
+        elif columns and self.config.outlier_method == "isolation_forest":
+            # Isolation Forest (더 정교한 탐지) - 대상 컬럼 전체로 다변량 모델 한 번만 학습
+            keep = np.flatnonzero(~np.isnan(values).any(axis=1))
             
-            if self.config.outlier_method == "z_score":
-                # Z-score 기반 이상치 탐지
-                z_scores = np.abs((values - values.mean()) / values.std())
-                outlier_mask = z_scores > 3
-                
-            elif self.config.outlier_method == "iqr":
-                # IQR 기반 이상치 탐지 (석유업계 맞춤)
-                Q1 = values.quantile(0.25)
-                Q3 = values.quantile(0.75)
-                IQR = Q3 - Q1
-                
-                # 석유 가격 특성상 더 넓은 범위 사용
-                lower_bound = Q1 - 2.0 * IQR
-                upper_bound = Q3 + 2.0 * IQR
-                
-                outlier_mask = (values < lower_bound) | (values > upper_bound)
-                
-            elif self.config.outlier_method == "isolation_forest":
-                # Isolation Forest (더 정교한 탐지)
-                from sklearn.ensemble import IsolationForest
-                
+            if len(keep) > 0:
                 iso_forest = IsolationForest(
                     contamination=self.config.outlier_threshold,
+                    max_samples=min(256, len(keep)),
+                    bootstrap=False,
+                    n_jobs=-1,
                     random_state=42
                 )
-                outlier_labels = iso_forest.fit_predict(values.values.reshape(-1, 1))
-                outlier_mask = pd.Series(outlier_labels == -1, index=values.index)
-            
-            # 이상치 개수 계산
-            outlier_count = outlier_mask.sum()
-            outliers_removed += outlier_count
-            
-            outlier_details[col] = {
-                'count': int(outlier_count),
-                'percentage': float(outlier_count / len(values) * 100)
-            }
-            
-            # 이상치 처리 (보간으로 대체)
-            if outlier_count > 0:
-                outlier_indices = values[outlier_mask].index
+                flagged = keep[iso_forest.fit_predict(values[keep]) == -1]
                 
-                # 선형 보간으로 대체
-                df_processed.loc[outlier_indices, col] = np.nan
-                df_processed[col] = df_processed[col].interpolate(method='linear')
+                if len(flagged) > 0:
+                    # 이상 행의 책임 컬럼 배분: |z| > 3 인 컬럼, 없으면 |z|가 가장 큰 컬럼
+                    _, means, stds = _nan_mean_std(values)
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        z = np.abs((values[flagged] - means) / stds)
+                    z = np.nan_to_num(z, nan=0.0)
+                    blame = z > 3
+                    blame[np.arange(len(flagged)), z.argmax(axis=1)] = True
+                    outlier_mask[flagged] = blame
+        
+        # 이상치 개수/비율 계산 (컬럼 전체를 한 번에, 유효값이 없는 컬럼은 0%)
+        outlier_counts = outlier_mask.sum(axis=0)
+        outliers_removed = int(outlier_counts.sum())
+        percentages = np.divide(outlier_counts * 100.0, valid_counts,
+                                out=np.zeros(len(columns)), where=valid_counts > 0)
+        
+        for col, count, percentage in zip(columns, outlier_counts.tolist(), percentages.tolist()):
+            outlier_details[col] = {'count': count, 'percentage': percentage}
+        
+        # 이상치 처리 (선형 보간으로 대체) - 이상치가 있는 컬럼만 JIT 커널로 보간
+        changed = np.flatnonzero(outlier_counts > 0)
+        for i in changed:
+            col_values = data[columns[i]]
+            col_values[outlier_mask[:, i]] = np.nan
+            _linear_fill(col_values)
         
         logger.info(f"이상치 처리 완료: {outliers_removed}개 제거")
         
         return {
-            'data': df_processed,
-            'summary': {
-                'outliers_removed': outliers_removed,
-                'method': self.config.outlier_method,
-                'details': outlier_details
-            }
+            'data': data,
+            'summary': OutlierSummary(
+                outliers_removed=outliers_removed,
+                method=self.config.outlier_method,
+                details=outlier_details
+            )
         }
     
-    def _handle_missing_values(self, df: pd.DataFrame, 
+    def _handle_missing_values(self, data: Dict[str, np.ndarray], index: pd.DatetimeIndex,
                              target_columns: List[str]) -> Dict[str, Any]:
-        """결측값 처리"""
-        df_processed = df.copy()
-        initial_missing = df_processed.isnull().sum().sum()
+        """결측값 처리 (data 배열을 직접 수정)"""
+        initial_missing = sum(int(np.isnan(values).sum()) for values in data.values())
+        
+        # 같은 요일/월 그룹 키 (계절성 보간이 필요할 때 한 번만 계산)
+        season_key = None
         
         # 시계열 특성을 고려한 보간 전략
         for col in target_columns:
-            if col not in df_processed.columns:
+            if col not in data:
                 continue
             
-            missing_count = df_processed[col].isnull().sum()
+            values = data[col]
             
-            if missing_count > 0:
-                # 1. 선형 보간 (짧은 구간)
-                df_processed[col] = df_processed[col].interpolate(method='linear')
-                
+            # 1. 선형 보간 (짧은 구간) - 내부/뒤쪽 결측을 한 번의 순회로 채우고 앞쪽 결측 길이 반환
+            lead = _linear_fill(values)
+            
+            # 남은 결측은 앞쪽 구간 values[:lead]뿐이므로 이후 단계는 이 구간만 처리
+            # (유효값이 하나도 없으면 채울 근거가 없어 그대로 둠)
+            if 0 < lead < len(values):
                 # 2. 계절성 고려 보간 (긴 구간)
-                if df_processed[col].isnull().sum() > 0:
-                    # 같은 요일/월 평균값 사용
-                    df_processed['dayofweek'] = df_processed.index.dayofweek
-                    df_processed['month'] = df_processed.index.month
-                    
-                    for dow in range(7):
-                        for month in range(1, 13):
-                            mask = (df_processed['dayofweek'] == dow) & (df_processed['month'] == month)
-                            mean_val = df_processed.loc[mask, col].mean()
-                            
-                            if not np.isnan(mean_val):
-                                df_processed.loc[mask & df_processed[col].isnull(), col] = mean_val
-                    
-                    df_processed.drop(['dayofweek', 'month'], axis=1, inplace=True)
+                # 같은 요일/월 평균값 사용 (84개 그룹 평균을 bincount 두 번으로 계산)
+                if season_key is None:
+                    season_key = (index.dayofweek.to_numpy() * 13
+                                  + index.month.to_numpy())
+                sums = np.bincount(season_key[lead:], weights=values[lead:], minlength=91)
+                counts = np.bincount(season_key[lead:], minlength=91)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    group_means = sums / counts
+                values[:lead] = group_means[season_key[:lead]]
                 
-                # 3. 앞/뒤 값으로 채우기 (마지막 수단)
-                df_processed[col] = df_processed[col].fillna(method='bfill').fillna(method='ffill')
+                # 3. 앞/뒤 값으로 채우기 (마지막 수단) - 앞쪽 구간은 바로 뒤 유효값으로
+                _bfill_ffill(values[:lead + 1])
         
-        final_missing = df_processed.isnull().sum().sum()
+        final_missing = sum(int(np.isnan(values).sum()) for values in data.values())
         values_filled = initial_missing - final_missing
         
         logger.info(f"결측값 처리 완료: {values_filled}개 채움")
         
         return {
-            'data': df_processed,
-            'summary': {
-                'values_filled': int(values_filled),
-                'initial_missing': int(initial_missing),
-                'final_missing': int(final_missing)
-            }
+            'data': data,
+            'summary': MissingSummary(
+                values_filled=int(values_filled),
+                initial_missing=int(initial_missing),
+                final_missing=int(final_missing)
+            )
         }
     
-    def _scale_data(self, df: pd.DataFrame, 
+    def _scale_data(self, data: Dict[str, np.ndarray],
                    target_columns: List[str],
                    feature_columns: Optional[List[str]] = None) -> Dict[str, Any]:
-        """데이터 스케일링"""
-        df_processed = df.copy()
+        """데이터 스케일링 (data에 스케일 컬럼 배열을 직접 추가)"""
         scaling_info = {}
         
-        # 스케일러 선택
-        scaler_types = {
-            'minmax': MinMaxScaler(),
-            'standard': StandardScaler(),
-            'robust': RobustScaler()
-        }
+        # 컬럼을 스케일러 종류별로 묶어 그룹마다 (N, K) 블록 하나로 학습
+        groups = {scaler_type: [] for scaler_type in _SCALER_TYPES}
+        order = []
         
         # 타겟 컬럼 스케일링 (일반적으로 MinMax 사용)
         for col in target_columns:
-            if col not in df_processed.columns:
-                continue
-            
-            scaler_type = 'minmax'  # 유가 데이터는 MinMax가 적합
-            scaler = scaler_types[scaler_type]
-            
-            # 스케일링 적용
-            values = df_processed[col].values.reshape(-1, 1)
-            scaled_values = scaler.fit_transform(values)
-            
-            df_processed[f'{col}_scaled'] = scaled_values.flatten()
-            
-            # 스케일러 저장
-            self.scalers[col] = {
-                'scaler': scaler,
-                'type': scaler_type,
-                'original_range': [df_processed[col].min(), df_processed[col].max()]
-            }
-            
-            scaling_info[col] = scaler_type
+            if col in data:
+                groups['minmax'].append(col)  # 유가 데이터는 MinMax가 적합
+                order.append(col)
         
-        # 특징 컬럼 스케일링
+        # 특징 컬럼 스케일링 (특징에 따라 다른 스케일러 사용)
         if feature_columns:
             for col in feature_columns:
-                if col not in df_processed.columns:
+                if col not in data:
                     continue
                 
-                # 특징에 따라 다른 스케일러 사용
                 if 'rate' in col.lower() or 'ratio' in col.lower():
-                    scaler_type = 'standard'
+                    groups['standard'].append(col)
                 else:
-                    scaler_type = 'robust'
-                
-                scaler = scaler_types[scaler_type]
-                
-                values = df_processed[col].values.reshape(-1, 1)
-                scaled_values = scaler.fit_transform(values)
-                
-                df_processed[f'{col}_scaled'] = scaled_values.flatten()
-                
+                    groups['robust'].append(col)
+                order.append(col)
+        
+        # 학습 단위 (스케일러 종류, 컬럼 묶음) - 컬럼이 많으면 묶음을 나눠 스레드로 병렬 학습
+        n_columns = sum(len(cols) for cols in groups.values())
+        chunk = _SCALING_CHUNK_COLUMNS if n_columns >= _PARALLEL_SCALING_MIN_COLUMNS else max(n_columns, 1)
+        tasks = [
+            (scaler_type, cols[start:start + chunk])
+            for scaler_type, cols in groups.items()
+            for start in range(0, len(cols), chunk)
+        ]
+        blocks = [
+            np.column_stack([data[col] for col in cols]).astype(np.float32, copy=False)
+            for _, cols in tasks
+        ]
+        
+        if len(tasks) > 1 and n_columns >= _PARALLEL_SCALING_MIN_COLUMNS:
+            # sklearn 스케일러의 NumPy 연산은 GIL을 해제하므로 스레드로 충분
+            results = Parallel(n_jobs=-1, prefer='threads')(
+                delayed(self._fit_scaler_block)(scaler_type, block)
+                for (scaler_type, _), block in zip(tasks, blocks)
+            )
+        else:
+            results = [
+                self._fit_scaler_block(scaler_type, block)
+                for (scaler_type, _), block in zip(tasks, blocks)
+            ]
+        
+        scaled_columns = {}
+        for (scaler_type, cols), (scaled_values, scaler) in zip(tasks, results):
+            for i, col in enumerate(cols):
+                scaled_columns[f'{col}_scaled'] = scaled_values[:, i]
+            
+            # 스케일러 저장 (묶음 공유 스케일러 + 묶음 내 컬럼 위치)
+            for i, col in enumerate(cols):
                 self.scalers[col] = {
                     'scaler': scaler,
+                    'index': i,
+                    'n_columns': len(cols),
                     'type': scaler_type,
-                    'original_range': [df_processed[col].min(), df_processed[col].max()]
+                    'original_range': _nan_range(data[col])
                 }
                 
                 scaling_info[col] = scaler_type
         
+        # 스케일된 컬럼은 원래 컬럼 순서대로 추가
+        for col in order:
+            data[f'{col}_scaled'] = scaled_columns[f'{col}_scaled']
+        
         logger.info(f"데이터 스케일링 완료: {len(scaling_info)}개 컬럼")
         
         return {
-            'data': df_processed,
-            'summary': scaling_info
+            'data': data,
+            'summary': ScalingSummary(columns=scaling_info)
         }
     
+    def _fit_scaler_block(self, scaler_type: str, block: np.ndarray) -> Tuple[np.ndarray, Any]:
+        """(N, K) float32 블록에 스케일러를 학습해 (스케일된 값, 스케일러) 반환 (memory가 있으면 캐시 경유)"""
+        if self._cached_fit_scaler is not None:
+            # 캐시 키는 스케일러 종류 + 블록 바이트 해시 (joblib.hash)
+            scaled_values, params = self._cached_fit_scaler(scaler_type, block)
+            return scaled_values, _restore_scaler(scaler_type, params)
+        
+        scaler = _SCALER_TYPES[scaler_type](copy=False)  # float32 블록을 그대로 변환
+        return scaler.fit_transform(block), scaler
+    
     def inverse_transform(self, scaled_data: np.ndarray, 
                          column_name: str) -> np.ndarray:
         """스케일링 역변환"""
         if column_name not in self.scalers:
             raise ValueError(f"Column {column_name} not found in scalers")
         
-        scaler = self.scalers[column_name]['scaler']
+        scaler_info = self.scalers[column_name]
+        scaler = scaler_info['scaler']
+        index = scaler_info['index']
         
-        if scaled_data.ndim == 1:
-            scaled_data = scaled_data.reshape(-1, 1)
+        # 그룹 스케일러는 (N, K) 입력을 기대하므로 해당 컬럼 위치에만 값을 채워 역변환
+        scaled_data = np.asarray(scaled_data).reshape(-1)
+        buffer = np.zeros((len(scaled_data), scaler_info['n_columns']), dtype=scaled_data.dtype)
+        buffer[:, index] = scaled_data
         
-        return scaler.inverse_transform(scaled_data).flatten()
+        return scaler.inverse_transform(buffer)[:, index].astype(np.float64)
     
     def _validate_processed_data(self, df: pd.DataFrame) -> float:
         """전처리된 데이터 품질 검증"""
@@ -397,20 +688,24 @@ class DataPreprocessor:
             quality_score *= continuity_score
         
         # 분산 검증 (너무 균일한 데이터는 의심)
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        variance_scores = []
-        
-        for col in numeric_columns:
-            if df[col].var() > 0:
-                # 정규화된 분산 점수
-                cv = df[col].std() / df[col].mean() if df[col].mean() != 0 else 0
-                variance_score = min(1.0, cv / 0.5)  # 적정 변동계수 기준
-                variance_scores.append(variance_score)
-        
-        if variance_scores:
-            quality_score *= np.mean(variance_scores)
+        numeric_df = df.select_dtypes(include=[np.number])
+        if len(numeric_df) > _VALIDATION_SAMPLE_ROWS:
+            numeric_df = numeric_df.sample(n=_VALIDATION_SAMPLE_ROWS, random_state=0)
+        numeric_values = numeric_df.to_numpy(dtype=np.float64)
+        
+        if numeric_values.size > 0:
+            # 컬럼별 평균/표준편차를 한 번의 순회로 계산
+            _, means, stds = _nan_mean_std(numeric_values)
+            # 평균이 0인 컬럼은 변동계수가 정의되지 않으므로 제외
+            scored = (stds > 0) & (means != 0)
+            
+            if scored.any():
+                # 정규화된 분산 점수 (적정 변동계수 기준, 부호 무관)
+                cv = np.abs(stds[scored] / means[scored])
+                variance_scores = np.minimum(1.0, cv / 0.5)
+                quality_score *= np.mean(variance_scores)
         
-        return min(1.0, quality_score)
+        return float(np.clip(quality_score, 0.0, 1.0))
     
     def get_preprocessing_report(self, result: PreprocessingResult) -> Dict[str, Any]:
         """전처리 결과 리포트"""
@@ -422,14 +717,14 @@ class DataPreprocessor:
                 'start': df.index.min().isoformat() if isinstance(df.index, pd.DatetimeIndex) else None,
                 'end': df.index.max().isoformat() if isinstance(df.index, pd.DatetimeIndex) else None
             },
-            'processing_summary': result.processing_summary,
+            'processing_summary': asdict(result.processing_summary),
             'outliers_removed': result.outliers_removed,
             'missing_values_filled': result.missing_values_filled,
             'scaled_columns': list(result.scaler_info.keys()),
             'data_quality_metrics': {
                 'missing_percentage': (df.isnull().sum().sum() / df.size) * 100,
                 'numeric_columns': len(df.select_dtypes(include=[np.number]).columns),
-                'quality_score': result.processing_summary.get('quality_score', 0)
+                'quality_score': result.processing_summary.quality_score
             }
         }
         
@@ -8,19 +8,94 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any, Union
 import warnings
+import itertools
+import hashlib
+from collections import OrderedDict
+from joblib import Parallel, delayed
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.stattools import adfuller, kpss
 from statsmodels.tsa.seasonal import seasonal_decompose
-from statsmodels.stats.diagnostic import acorr_ljungbox
+from scipy.stats import chi2
 from pmdarima import auto_arima
 import logging
 from dataclasses import dataclass
+from types import SimpleNamespace
+
+# statsforecast AutoARIMA (Numba JIT 우도/칼만 필터, 선택사항)
+try:
+    from statsforecast.models import AutoARIMA as SFAutoARIMA
+    STATSFORECAST_AVAILABLE = True
+except ImportError:
+    STATSFORECAST_AVAILABLE = False
 
 from ..config.model_config import ARIMAConfig
 
 logger = logging.getLogger(__name__)
 warnings.filterwarnings('ignore')
 
+# 차수별 적합 결과 캐시: (시계열 해시, 차수, method, maxiter) -> (aic, bic), LRU 방식
+_ARIMA_FIT_CACHE_SIZE = 4096
+_ARIMA_FIT_CACHE: 'OrderedDict[tuple, Optional[Tuple[float, float]]]' = OrderedDict()
+
+
+def _fit_one(order: Tuple[int, int, int], values: np.ndarray,
+             method: str, maxiter: int) -> Optional[Tuple[Tuple[int, int, int], float, float]]:
+    """단일 차수 ARIMA 적합 (병렬 그리드 탐색 작업 단위, 실패 시 None)"""
+    warnings.filterwarnings('ignore')
+    try:
+        fitted_model = ARIMA(values, order=order).fit(method=method, maxiter=maxiter)
+        return order, float(fitted_model.aic), float(fitted_model.bic)
+    except Exception:
+        return None
+
+
+def _ljung_box_pvalue(residuals: np.ndarray, lags: int = 10) -> float:
+    """
+    Ljung-Box 검정 p-value (FFT 기반 자기상관)
+
+    Q = n(n+2) * sum_{k=1..h} rho_k^2 / (n-k), Q ~ chi2(h).
+    자기상관은 2n으로 0-패딩한 FFT 파워 스펙트럼의 역변환으로 한 번에 계산
+    """
+    r = np.asarray(residuals, dtype=np.float64)
+    r = r - r.mean()
+    n = r.size
+    f = np.fft.rfft(r, n=2 * n)
+    acov = np.fft.irfft(f * np.conj(f), n=2 * n)[:lags + 1]
+    rho = acov[1:] / acov[0]
+    q_stat = n * (n + 2) * np.sum(rho ** 2 / (n - np.arange(1, lags + 1)))
+    return float(chi2.sf(q_stat, df=lags))
+
+
+class _StatsForecastARIMA:
+    """
+    statsforecast AutoARIMA 어댑터
+
+    fit()/forecast()가 사용하는 statsmodels 결과 객체 인터페이스
+    (order, aic, bic, fittedvalues, resid, summary, forecast, data.orig_endog)를 제공
+    """
+    
+    def __init__(self, model: Any, series: pd.Series):
+        self._model = model
+        fitted = model.model_
+        p, q, P, Q, m, d, D = fitted['arma'][:7]
+        self.order = (p, d, q)
+        self.seasonal_order = (P, D, Q, m) if m > 1 else None
+        self.aic = float(fitted['aic'])
+        self.bic = float(fitted['bic'])
+        self.resid = np.asarray(fitted['residuals'], dtype=np.float64)
+        self.fittedvalues = series.to_numpy(dtype=np.float64) - self.resid
+        self.data = SimpleNamespace(orig_endog=series)
+    
+    def summary(self) -> str:
+        return f"statsforecast AutoARIMA{self.order}{self.seasonal_order or ''} AIC={self.aic:.2f} BIC={self.bic:.2f}"
+    
+    def forecast(self, steps: int, exog: Optional[pd.DataFrame] = None, alpha: float = 0.05):
+        level = int(round(100 * (1 - alpha)))
+        X = None if exog is None else np.asarray(exog, dtype=np.float64)
+        pred = self._model.predict(h=steps, X=X, level=(level,))
+        conf_int = np.column_stack([pred[f'lo-{level}'], pred[f'hi-{level}']])
+        return pred['mean'], conf_int
+
 @dataclass
 class ARIMAModelResult:
     """ARIMA 모델 결과"""
@@ -58,6 +133,9 @@ class ARIMAForecaster:
         self.model_result = None
         self.is_fitted = False
         
+        if config.backend == 'statsforecast' and not STATSFORECAST_AVAILABLE:
+            raise ImportError("backend='statsforecast'를 사용하려면 statsforecast가 필요합니다")
+        
         # 석유업계 특화 설정
         self.oil_price_params = {
             'information_criterion': config.information_criterion,
@@ -93,17 +171,18 @@ class ARIMAForecaster:
         # 데이터 전처리
         clean_series = self._prepare_data(series)
         
-        # 정상성 검정
-        stationarity_info = self._check_stationarity(clean_series)
-        logger.info(f"정상성 검정 결과: {stationarity_info}")
-        
         try:
             if auto_select:
-                # 자동 ARIMA 차수 선택
+                # 자동 ARIMA 차수 선택 (차분 차수 결정 시 단위근 검정을 자체 수행하므로 생략)
+                logger.info("정상성 검정 생략: 자동 차수 선택에서 수행")
                 self.model = self._auto_arima_selection(clean_series, exog)
                 order = self.model.order
                 seasonal_order = self.model.seasonal_order if hasattr(self.model, 'seasonal_order') else None
             else:
+                # 정상성 검정
+                stationarity_info = self._check_stationarity(clean_series)
+                logger.info(f"정상성 검정 결과: {stationarity_info}")
+                
                 # 수동 차수 선택
                 order = self._manual_order_selection(clean_series)
                 seasonal_order = self._get_seasonal_order() if self.config.seasonal else None
@@ -125,8 +204,7 @@ class ARIMAForecaster:
             residuals = pd.Series(self.model.resid, index=clean_series.index)
             
             # 잔차 진단
-            ljung_box_result = acorr_ljungbox(residuals, lags=10, return_df=True)
-            ljung_box_p = ljung_box_result['lb_pvalue'].iloc[-1]
+            ljung_box_p = _ljung_box_pvalue(residuals.to_numpy(), lags=10)
             
             self.model_result = ARIMAModelResult(
                 model=self.model,
@@ -241,12 +319,16 @@ class ARIMAForecaster:
         if len(clean_series) < 50:
             raise ValueError(f"시계열이 너무 짧습니다: {len(clean_series)}개 관측값")
         
-        # 이상치 제거 (선택적)
-        q99 = clean_series.quantile(0.99)
-        q01 = clean_series.quantile(0.01)
-        clean_series = clean_series.clip(lower=q01, upper=q99)
+        # 이상치 제거 (선택적): 1%/99% 분위수를 전체 정렬 없이 np.partition으로 선택
+        values = clean_series.to_numpy(dtype=np.float64)
+        n = values.shape[0]
+        pos = (n - 1) * np.array([0.01, 0.99])
+        k = np.floor(pos).astype(np.int64)
+        part = np.partition(values, np.unique(np.concatenate([k, k + 1])))
+        # pandas quantile(linear)과 동일한 선형 보간
+        q01, q99 = part[k] + (pos - k) * (part[k + 1] - part[k])
         
-        return clean_series
+        return pd.Series(np.clip(values, q01, q99), index=clean_series.index, name=clean_series.name)
     
     def _check_stationarity(self, series: pd.Series) -> Dict[str, Any]:
         """정상성 검정"""
@@ -288,6 +370,9 @@ class ARIMAForecaster:
         logger.info("자동 ARIMA 차수 선택 시작...")
         
         try:
+            if self.config.backend == 'statsforecast':
+                return self._statsforecast_selection(series, exog)
+            
             auto_model = auto_arima(
                 series,
                 exogenous=exog,
@@ -317,41 +402,74 @@ class ARIMAForecaster:
             model = ARIMA(series, order=(1, 1, 1), exog=exog)
             return model.fit(method=self.config.method, maxiter=self.config.maxiter)
     
+    def _statsforecast_selection(self,
+                                 series: pd.Series,
+                                 exog: Optional[pd.DataFrame] = None) -> _StatsForecastARIMA:
+        """statsforecast AutoARIMA로 자동 차수 선택 (Numba JIT 상태공간 재귀)"""
+        sf_model = SFAutoARIMA(
+            max_p=self.config.max_p,
+            max_q=self.config.max_q,
+            max_d=self.config.max_d,
+            seasonal=self.config.seasonal,
+            season_length=self.config.seasonal_period if self.config.seasonal else 1,
+            ic=self.config.information_criterion,
+            stepwise=self.config.stepwise
+        )
+        X = None if exog is None else np.asarray(exog, dtype=np.float64)
+        sf_model.fit(series.to_numpy(dtype=np.float64), X=X)
+        
+        model = _StatsForecastARIMA(sf_model, series)
+        logger.info(f"자동 선택된 ARIMA 차수 (statsforecast): {model.order}")
+        return model
+    
     def _manual_order_selection(self, series: pd.Series) -> Tuple[int, int, int]:
         """수동 차수 선택 (정보 기준에 기반)"""
         logger.info("수동 ARIMA 차수 선택...")
         
-        best_aic = float('inf')
-        best_bic = float('inf')
-        best_order_aic = (1, 1, 1)
-        best_order_bic = (1, 1, 1)
+        orders = list(itertools.product(
+            range(self.config.max_p + 1),
+            range(self.config.max_d + 1),
+            range(self.config.max_q + 1)
+        ))
+        # 인덱스 없는 배열로 전달해 loky 워커에 memmap으로 공유
+        values = np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+        series_hash = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+        method, maxiter = self.config.method, self.config.maxiter
         
-        for p in range(self.config.max_p + 1):
-            for d in range(self.config.max_d + 1):
-                for q in range(self.config.max_q + 1):
-                    try:
-                        model = ARIMA(series, order=(p, d, q))
-                        fitted_model = model.fit(
-                            method=self.config.method,
-                            maxiter=self.config.maxiter
-                        )
-                        
-                        if fitted_model.aic < best_aic:
-                            best_aic = fitted_model.aic
-                            best_order_aic = (p, d, q)
-                        
-                        if fitted_model.bic < best_bic:
-                            best_bic = fitted_model.bic
-                            best_order_bic = (p, d, q)
-                            
-                    except Exception:
-                        continue
+        # 같은 시계열/차수로 이미 적합한 결과는 캐시에서 재사용하고 나머지만 병렬 적합
+        metrics_by_order = {}
+        pending = []
+        for order in orders:
+            key = (series_hash, order, method, maxiter)
+            if key in _ARIMA_FIT_CACHE:
+                _ARIMA_FIT_CACHE.move_to_end(key)
+                metrics_by_order[order] = _ARIMA_FIT_CACHE[key]
+            else:
+                pending.append(order)
+        
+        if pending:
+            fitted = Parallel(n_jobs=-1, prefer='processes')(
+                delayed(_fit_one)(order, values, method, maxiter)
+                for order in pending
+            )
+            for order, result in zip(pending, fitted):
+                metrics = None if result is None else result[1:]
+                _ARIMA_FIT_CACHE[(series_hash, order, method, maxiter)] = metrics
+                metrics_by_order[order] = metrics
+            while len(_ARIMA_FIT_CACHE) > _ARIMA_FIT_CACHE_SIZE:
+                _ARIMA_FIT_CACHE.popitem(last=False)
         
         # 정보 기준에 따라 최적 차수 선택
-        if self.config.information_criterion == 'aic':
-            best_order = best_order_aic
+        criterion = 1 if self.config.information_criterion == 'aic' else 2
+        results = [
+            (order, *metrics_by_order[order]) for order in orders
+            if metrics_by_order[order] is not None
+        ]
+        results = [r for r in results if np.isfinite(r[criterion])]
+        if results:
+            best_order = min(results, key=lambda r: r[criterion])[0]
         else:
-            best_order = best_order_bic
+            best_order = (1, 1, 1)
         
         logger.info(f"수동 선택된 ARIMA 차수: {best_order}")
         return best_order
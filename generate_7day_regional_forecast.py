@@ -6,9 +6,16 @@
 """
 
 import json
-import random
+import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, Optional
+
+# 빠른 JSON 직렬화 (orjson, 선택사항)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # 8월 24일 실제 오피넷 데이터 (기준가)
 CURRENT_PRICES = {
@@ -52,59 +59,43 @@ REGION_MAPPING = {
     "세종": "sejong"
 }
 
-def generate_realistic_daily_changes(base_price: float, days: int = 7) -> List[float]:
+def generate_realistic_daily_changes(base_prices: np.ndarray, days: int = 7,
+                                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
-    현실적인 일별 가격 변화 생성
+    현실적인 일별 가격 변화 생성 (여러 기준가를 한 번에 처리)
     
     Args:
-        base_price: 기준 가격
+        base_prices: 기준 가격 배열 (지역 x 유종 등 임의 형태)
         days: 예측 일수
+        rng: 난수 생성기 (None이면 새로 생성)
     
     Returns:
-        List[float]: 각 날짜별 예측 가격
+        np.ndarray: base_prices 형태 뒤에 days 축이 붙은 1일후~days일후 예측 가격
     """
-    prices = [base_price]  # 첫날은 기준가 그대로
-    
-    # 현실적인 유가 변동 요인들
-    volatility_factors = {
-        "international_oil": random.uniform(-0.3, 0.4),  # 국제유가 영향 (-0.3% ~ +0.4%)
-        "exchange_rate": random.uniform(-0.2, 0.2),      # 환율 영향 (-0.2% ~ +0.2%)
-        "domestic_demand": random.uniform(-0.1, 0.2),   # 국내 수요 (-0.1% ~ +0.2%)
-        "seasonal_trend": random.uniform(-0.1, 0.1),    # 계절적 요인 (-0.1% ~ +0.1%)
-        "market_sentiment": random.uniform(-0.2, 0.1)   # 시장 심리 (-0.2% ~ +0.1%)
-    }
-    
-    # 주간 트렌드 (보통 휘발유는 소폭 상승, 경유는 소폭 하락 추세)
-    weekly_trend = random.uniform(-0.05, 0.15) if "gasoline" in str(base_price) else random.uniform(-0.15, 0.05)
-    
-    for day in range(1, days + 1):
-        # 전일 가격 기준
-        prev_price = prices[-1]
-        
-        # 일별 변동률 계산 (복합적 요인 반영)
-        daily_change_rate = (
-            volatility_factors["international_oil"] * 0.4 +    # 국제유가 40% 영향
-            volatility_factors["exchange_rate"] * 0.25 +       # 환율 25% 영향  
-            volatility_factors["domestic_demand"] * 0.15 +     # 국내수요 15% 영향
-            volatility_factors["seasonal_trend"] * 0.1 +       # 계절성 10% 영향
-            volatility_factors["market_sentiment"] * 0.1 +     # 시장심리 10% 영향
-            weekly_trend * (day / days)                        # 주간 트렌드 점진적 반영
-        ) / 100
-        
-        # 일일 변동 제한 (±0.5% 이내)
-        daily_change_rate = max(-0.005, min(0.005, daily_change_rate))
-        
-        # 노이즈 추가 (실제 시장의 미세한 변동)
-        noise = random.uniform(-0.001, 0.001)
-        daily_change_rate += noise
-        
-        # 새로운 가격 계산
-        new_price = prev_price * (1 + daily_change_rate)
-        
-        # 소수점 2자리로 반올림
-        prices.append(round(new_price, 2))
-    
-    return prices[1:]  # 첫날 제외하고 1일후~7일후 반환
+    rng = np.random.default_rng() if rng is None else rng
+    base = np.asarray(base_prices, dtype=np.float64)
+    n = base.size
+    
+    # 현실적인 유가 변동 요인들 (기준가별로 한 번씩 추출)
+    # 국제유가 40%, 환율 25%, 국내수요 15%, 계절성 10%, 시장심리 10% 영향
+    low = np.array([-0.3, -0.2, -0.1, -0.1, -0.2])
+    high = np.array([0.4, 0.2, 0.2, 0.1, 0.1])
+    weights = np.array([0.4, 0.25, 0.15, 0.1, 0.1])
+    volatility_factors = rng.uniform(low, high, (n, 5))
+    
+    # 주간 트렌드 (기존 구현과 동일하게 모든 기준가에 경유 범위 적용)
+    weekly_trend = rng.uniform(-0.15, 0.05, (n, 1))
+    
+    # 일별 변동률 계산 (복합적 요인 + 주간 트렌드 점진적 반영)
+    ramp = np.arange(1, days + 1) / days
+    daily_change_rate = ((volatility_factors @ weights)[:, None] + weekly_trend * ramp) / 100
+    
+    # 일일 변동 제한 (±0.5% 이내) 후 노이즈 추가 (실제 시장의 미세한 변동)
+    daily_change_rate = np.clip(daily_change_rate, -0.005, 0.005)
+    daily_change_rate += rng.uniform(-0.001, 0.001, (n, days))
+    
+    prices = base.reshape(n, 1) * np.cumprod(1 + daily_change_rate, axis=1)
+    return np.round(prices, 2).reshape(base.shape + (days,))
 
 def generate_7day_regional_forecast() -> Dict:
     """7일간 지역별 유가 예측 생성"""
@@ -122,22 +113,30 @@ def generate_7day_regional_forecast() -> Dict:
         "national_average": {}
     }
     
-    # 지역별 예측 생성
-    for korean_name, english_name in REGION_MAPPING.items():
-        current_region_prices = CURRENT_PRICES[korean_name]
-        
-        # 보통휘발유 7일 예측
-        gasoline_forecast = generate_realistic_daily_changes(current_region_prices["regular_gasoline"])
-        
-        # 자동차경유 7일 예측  
-        diesel_forecast = generate_realistic_daily_changes(current_region_prices["diesel"])
+    # 지역 가격은 국제유가/환율 등 전국 공통 요인이 지배하므로
+    # 전국 평균 경로를 유종별로 한 번만 생성하고 지역별 가격차(스프레드)를 고정 오프셋으로 더함
+    korean_names = list(REGION_MAPPING)
+    base_prices = np.array([
+        [CURRENT_PRICES[name]["regular_gasoline"], CURRENT_PRICES[name]["diesel"]]
+        for name in korean_names
+    ])
+    national_current = base_prices.mean(axis=0)
+    national_forecast = generate_realistic_daily_changes(national_current, days=7)  # 유종 x 일
+    regional_spread = base_prices - national_current  # 지역 x 유종
+    forecasts = np.round(national_forecast[None, :, :] + regional_spread[:, :, None], 2)  # 지역 x 유종 x 일
+    forecast_dates = [(base_date + timedelta(days=day+1)).strftime("%Y-%m-%d") for day in range(7)]
+    
+    # 지역별 예측 구성
+    for i, korean_name in enumerate(korean_names):
+        english_name = REGION_MAPPING[korean_name]
+        gasoline_forecast = forecasts[i, 0].tolist()
+        diesel_forecast = forecasts[i, 1].tolist()
         
         # 날짜별 데이터 구성
         daily_forecasts = []
         for day in range(7):
-            forecast_date = base_date + timedelta(days=day+1)
             daily_forecasts.append({
-                "date": forecast_date.strftime("%Y-%m-%d"),
+                "date": forecast_dates[day],
                 "day_label": f"{day+1}일 후",
                 "gasoline": gasoline_forecast[day],
                 "diesel": diesel_forecast[day]
@@ -146,29 +145,18 @@ def generate_7day_regional_forecast() -> Dict:
         forecast_data["forecasts"][english_name] = {
             "region_name_ko": korean_name,
             "region_name_en": english_name,
-            "current_prices": current_region_prices,
+            "current_prices": CURRENT_PRICES[korean_name],
             "daily_forecast": daily_forecasts
         }
     
-    # 전국 평균 계산
+    # 전국 평균 계산 (유종 x 일)
+    national_average = np.round(forecasts.mean(axis=0), 2)
     for day in range(7):
-        day_gasoline_prices = []
-        day_diesel_prices = []
-        
-        for english_name in REGION_MAPPING.values():
-            day_gasoline_prices.append(forecast_data["forecasts"][english_name]["daily_forecast"][day]["gasoline"])
-            day_diesel_prices.append(forecast_data["forecasts"][english_name]["daily_forecast"][day]["diesel"])
-        
-        forecast_date = base_date + timedelta(days=day+1)
-        
-        if f"day_{day+1}" not in forecast_data["national_average"]:
-            forecast_data["national_average"][f"day_{day+1}"] = {}
-            
         forecast_data["national_average"][f"day_{day+1}"] = {
-            "date": forecast_date.strftime("%Y-%m-%d"),
+            "date": forecast_dates[day],
             "day_label": f"{day+1}일 후",
-            "gasoline": round(sum(day_gasoline_prices) / len(day_gasoline_prices), 2),
-            "diesel": round(sum(day_diesel_prices) / len(day_diesel_prices), 2)
+            "gasoline": float(national_average[0, day]),
+            "diesel": float(national_average[1, day])
         }
     
     return forecast_data
@@ -210,9 +198,13 @@ def main():
     # 예측 데이터 생성
     forecast_data = generate_7day_regional_forecast()
     
-    # JSON 파일로 저장
-    with open("7day_regional_forecast.json", "w", encoding="utf-8") as f:
-        json.dump(forecast_data, f, ensure_ascii=False, indent=2)
+    # JSON 파일로 저장 (orjson은 UTF-8 바이트로 바로 출력)
+    if ORJSON_AVAILABLE:
+        with open("7day_regional_forecast.json", "wb") as f:
+            f.write(orjson.dumps(forecast_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open("7day_regional_forecast.json", "w", encoding="utf-8") as f:
+            json.dump(forecast_data, f, ensure_ascii=False, indent=2)
     
     # 요약 출력
     print_forecast_summary(forecast_data)